@@ -1,5 +1,6 @@
 # gformfiller/api/fillers.py
 
+import asyncio
 import logging
 import os
 from typing import Dict, Any, List, Optional
@@ -158,9 +159,8 @@ async def upload_filler_files(
             raise HTTPException(status_code=404, detail="Filler directory structure not found.")
 
         for file in files:
-            file_path = files_dir / file.filename
-            with open(file_path, "wb") as f:
-                f.write(await file.read())
+            # Stream the spooled upload straight to disk, off the event loop
+            await asyncio.to_thread(fm.save_file, current_user, filler_name, file.filename, file.file)
             uploaded_names.append(file.filename)
             
         return {"message": f"Uploaded {len(uploaded_names)} files.", "files": uploaded_names}
@@ -13,7 +13,6 @@ from fastapi import (
 from .deps import get_current_user
 from gformfiller.core.constants import Status
 from gformfiller.infrastructure.folder_manager.constants import (
-    FILES_SUBDIR,
     FileKeys,
     LOCK_FILE,
 )
@@ -85,13 +84,9 @@ async def register_candidate(
     filler_name = f"cand_{uuid.uuid4().hex[:8]}"
     fm.create_filler(current_user, filler_name)
 
-    filler_paths = fm.get_filler_paths(current_user, filler_name)
-    files_dir = filler_paths[FILES_SUBDIR]
-    photo_path = files_dir / photo.filename
-    doc_path = files_dir / document.filename
-    
-    with open(photo_path, "wb") as f: f.write(await photo.read())
-    with open(doc_path, "wb") as f: f.write(await document.read())
+    # Copie des fichiers dans un thread pour ne pas bloquer la boucle d'événements
+    photo_path = await asyncio.to_thread(fm.save_file, current_user, filler_name, photo.filename, photo.file)
+    doc_path = await asyncio.to_thread(fm.save_file, current_user, filler_name, document.filename, document.file)
 
     form_data = {
         "TextResponse": {
@@ -1,5 +1,6 @@
 # gformfiller/api/system.py
 
+import asyncio
 from .deps import get_current_user
 from fastapi import APIRouter, Request, HTTPException, Body, Depends
 from typing import List, Dict, Any
@@ -47,11 +48,12 @@ async def get_system_logs(
     Fetch the latest logs from the SQLite log database.
     """
     fm = request.app.state.folder_manager
-    db_logger = fm.get_db_logger(current_user)
+    # Flushing queued actions and querying SQLite both block: keep them off the event loop
+    db_logger = await asyncio.to_thread(fm.get_db_logger, current_user)
     # We assume FolderManager provides access to the DB logger's fetch method
     try:
         # If your FolderManager has a reference to the db_logger:
-        logs = db_logger.get_logs(limit=limit)
+        logs = await asyncio.to_thread(db_logger.get_logs, limit=limit)
         return logs
 
     except AttributeError:
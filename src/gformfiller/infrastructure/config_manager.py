@@ -2,7 +2,8 @@
 
 import json
 import logging
-from typing import Any, Dict
+import os
+from typing import Any, Dict, Optional, Tuple
 import tomllib
 import tomli_w
 from .folder_manager import FolderManager
@@ -19,6 +20,18 @@ class ConfigManager:
 
     def __init__(self, folder_manager: FolderManager):
         self._fm = folder_manager
+        # (user_id, filler_name) -> (default.toml signature, overrides, resolved config)
+        self._resolved_cache: Dict[
+            Tuple[str, str], Tuple[Optional[Tuple[int, int]], Dict[str, Any], FillerConfig]
+        ] = {}
+
+    def _default_config_signature(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of default.toml, or None when it does not exist."""
+        try:
+            st = os.stat(self._fm.default_config)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
 
     def get_default_config(self) -> Dict[str, Any]:
         """Loads the global configuration from .gformfiller/default.toml."""
@@ -52,6 +65,8 @@ class ConfigManager:
     
         with open(self._fm.default_config, "wb") as f:
             tomli_w.dump({"default": current_config}, f)
+        # Don't rely on mtime alone: coarse timestamps may not move
+        self._resolved_cache.clear()
 
 
     def get_filler_config(self, user_id: str, filler_name: str) -> Dict[str, Any]:
@@ -62,12 +77,28 @@ class ConfigManager:
             return {}
 
     def get_resolved_config(self, user_id: str, filler_name: str) -> FillerConfig:
-        defaults = self.get_default_config()
+        """
+        Merge defaults with the filler's overrides and validate the result.
+
+        The validated config is reused while default.toml is unchanged on disk
+        and the filler's overrides are equal to the last ones seen. Overrides
+        are compared by content because FolderManager may buffer writes.
+        """
+        # Stat before reading, so a concurrent edit can only cause a miss
+        default_sig = self._default_config_signature()
         overrides = self.get_filler_config(user_id, filler_name)
-        
+
+        key = (user_id, filler_name)
+        cached = self._resolved_cache.get(key)
+        if cached is not None and cached[0] == default_sig and cached[1] == overrides:
+            return cached[2].model_copy()
+
+        defaults = self.get_default_config()
         merged_data = {**defaults, **overrides}
         
-        return FillerConfig.model_validate(merged_data)
+        config = FillerConfig.model_validate(merged_data)
+        self._resolved_cache[key] = (default_sig, overrides, config)
+        return config.model_copy()
 
     def save_filler_config(self, user_id: str, filler_name: str, config_data: Dict[str, Any]):
         """Persists new configuration data to the filler's config.json."""
@@ -2,8 +2,11 @@
 
 """Module for creating and configuring chromedriver"""
 
+import copy
+import functools
 import logging
 from pathlib import Path
+from typing import Any
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
@@ -124,63 +127,114 @@ def _get_chromeoptions(
 ) -> ChromeOptions:
     """Configure chrome options"""
 
-    options = ChromeOptions()
+    # Checked on every call: the binary may appear or vanish between spawns
+    if not remote and binary_location and not Path(binary_location).exists():
+        raise BrowserNotFoundError("chrome", binary_location)
+
+    recipe = _options_recipe(
+        binary_location, user_data_dir, remote, remote_host, remote_port,
+        headless, user_agent, disable_images, no_sandbox, disable_gpu,
+        disable_dev_shm, page_load_strategy, window_size
+    )
+    return _apply_recipe(recipe)
+
+
+OptionsRecipe = tuple[
+    tuple[tuple[str, Any], ...],  # attributes to set
+    tuple[str, ...],              # arguments
+    tuple[tuple[str, Any], ...],  # experimental options
+]
+
+
+@functools.lru_cache(maxsize=8)
+def _options_recipe(
+    binary_location: str | None,
+    user_data_dir: str | None,
+    remote: bool,
+    remote_host: str,
+    remote_port: int,
+    headless: bool,
+    user_agent: str | None,
+    disable_images: bool,
+    no_sandbox: bool,
+    disable_gpu: bool,
+    disable_dev_shm: bool,
+    page_load_strategy: str,
+    window_size: str | None
+) -> OptionsRecipe:
+    """Describe the chrome options for a configuration, without touching Selenium"""
 
     # Remote debugging
     if remote:
-        options.debugger_address = f"{remote_host}:{remote_port}"
-        return options
+        return (("debugger_address", f"{remote_host}:{remote_port}"),), (), ()
+
+    attributes: list[tuple[str, Any]] = []
+    arguments: list[str] = []
+    experimental: list[tuple[str, Any]] = []
 
     # Binary location
     if binary_location:
-        if not Path(binary_location).exists():
-            raise BrowserNotFoundError("chrome", binary_location)
-        options.binary_location = binary_location
+        attributes.append(("binary_location", binary_location))
 
     # User data dir
     if user_data_dir:
-        options.add_argument(f"user-data-dir={user_data_dir}")
+        arguments.append(f"user-data-dir={user_data_dir}")
 
     # Headless
     if headless:
-        options.add_argument("--headless=new")  # New headless mode
-    
+        arguments.append("--headless=new")  # New headless mode
+
     # User agent
     if user_agent:
-        options.add_argument(f"user-agent={user_agent}")
+        arguments.append(f"user-agent={user_agent}")
     elif not user_agent and headless:
         # Use default desktop user agent in headless to avoid detection
-        options.add_argument(f"user-agent={DEFAULT_USER_AGENTS['chrome']}")
-    
+        arguments.append(f"user-agent={DEFAULT_USER_AGENTS['chrome']}")
+
     if disable_images:
         prefs: dict[str, int] = {"profile.managed_default_content_settings.images": 2}
-        options.add_experimental_option("prefs", prefs)
-    
+        experimental.append(("prefs", prefs))
+
     # Docker/CI options
     if no_sandbox:
-        options.add_argument("--no-sandbox")
-    
+        arguments.append("--no-sandbox")
+
     if disable_gpu:
-        options.add_argument("--disable-gpu")
-    
+        arguments.append("--disable-gpu")
+
     if disable_dev_shm:
-        options.add_argument("--disable-dev-shm-usage")
+        arguments.append("--disable-dev-shm-usage")
 
     if window_size:
-        options.add_argument(f'--window-size="{window_size}"')
+        arguments.append(f'--window-size="{window_size}"')
     # Page load strategy
-    options.page_load_strategy = page_load_strategy
-    
+    attributes.append(("page_load_strategy", page_load_strategy))
+
     # Additional recommended options
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option("useAutomationExtension", False)
-    
+    arguments.append("--disable-blink-features=AutomationControlled")
+    experimental.append(("excludeSwitches", ["enable-automation"]))
+    experimental.append(("useAutomationExtension", False))
+
     # Disable unnecessary features
-    options.add_argument("--disable-extensions")
-    options.add_argument("--disable-popup-blocking")
-    options.add_argument("--disable-notifications")
+    arguments.append("--disable-extensions")
+    arguments.append("--disable-popup-blocking")
+    arguments.append("--disable-notifications")
 
+    return tuple(attributes), tuple(arguments), tuple(experimental)
+
+
+def _apply_recipe(recipe: OptionsRecipe) -> ChromeOptions:
+    """Build a fresh ChromeOptions from a (cached) recipe"""
+
+    attributes, arguments, experimental = recipe
+    options = ChromeOptions()
+    for name, value in attributes:
+        setattr(options, name, value)
+    for argument in arguments:
+        options.add_argument(argument)
+    for name, value in experimental:
+        # The recipe is shared between calls; never hand out its mutable values
+        options.add_experimental_option(name, copy.deepcopy(value))
     return options
 
 
@@ -1,5 +1,7 @@
+import functools
 import logging
-from typing import Optional
+from typing import Iterable, List, Optional
+from .codegen import Predicate, compile_predicate
 from .lexer import Lexer
 from .parser import Parser
 from .evaluator import Evaluator
@@ -7,6 +9,27 @@ from .exceptions import DSLError, LexerError, ParserError, EvaluationError
 
 logger = logging.getLogger(__name__)
 
+_evaluator = Evaluator()
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(expression: str, ignore_case: bool) -> Predicate:
+    """
+    Lex, parse and compile an expression once; later calls reuse the predicate.
+
+    The expression is lowercased here when ignore_case is set, so the
+    returned predicate is already case-normalized. Expressions nested too
+    deeply for Python's compiler are evaluated by walking the AST instead.
+    """
+    if ignore_case:
+        expression = expression.lower()
+    tokens = Lexer(expression).tokenize()
+    ast = Parser(tokens).parse()
+    try:
+        return compile_predicate(ast)
+    except (SyntaxError, RecursionError, MemoryError):
+        return functools.partial(_evaluator.evaluate, ast)
+
 
 def match(text: str, expression: str, ignore_case: bool = True) -> Optional[bool]:
     """
@@ -18,6 +41,10 @@ def match(text: str, expression: str, ignore_case: bool = True) -> Optional[bool
     3. Parsing (AST Construction)
     4. Evaluation of the AST against the text
 
+    Steps 2 and 3 (plus compiling the AST to a Python predicate) are cached
+    per (expression, ignore_case), so matching the same expression against
+    many texts only pays for one function call each.
+
     Args:
         text (str): The target text to search within.
         expression (str): The search expression in DSL format.
@@ -33,24 +60,16 @@ def match(text: str, expression: str, ignore_case: bool = True) -> Optional[bool
         return True
         
     try:
-        # 1. Pre-processing: Case normalization
+        # 1. Pre-processing: Case normalization of the text
+        # (the expression is normalized by _compile)
         if ignore_case:
             text = text.lower()
-            expression = expression.lower()
-
-        # 2. Lexing: Convert the expression into a list of tokens
-        lexer = Lexer(expression)
-        tokens = lexer.tokenize()
-
-        # 3. Parsing: Convert the token list into an AST
-        parser = Parser(tokens)
-        ast = parser.parse()
 
-        # 4. Evaluation: Evaluate the AST against the target text
-        evaluator = Evaluator()
-        result = evaluator.evaluate(ast, text)
+        # 2-3. Lexing, parsing and compiling, cached per expression
+        predicate = _compile(expression, ignore_case)
 
-        return result
+        # 4. Evaluation: Run the compiled predicate against the target text
+        return predicate(text)
 
     except (LexerError, ParserError, EvaluationError) as e:
         # Log the specific DSL error before returning None
@@ -62,4 +81,37 @@ def match(text: str, expression: str, ignore_case: bool = True) -> Optional[bool
                 'text_snippet': text[:50] + '...' if len(text) > 50 else text
             }
         )
-        return None
\ No newline at end of file
+        return None
+
+
+def match_many(
+    texts: Iterable[str], expression: str, ignore_case: bool = True
+) -> List[Optional[bool]]:
+    """
+    Evaluates one DSL expression against a batch of texts.
+
+    Equivalent to `[match(t, expression, ignore_case) for t in texts]`, but
+    the expression is compiled and its errors are handled once for the
+    whole batch, e.g. when checking every option label of a question.
+
+    Returns:
+        List[Optional[bool]]: One result per text, in order. Every entry is
+                              None if the expression is invalid.
+    """
+    texts = list(texts)
+    if not expression:
+        return [True] * len(texts)
+
+    try:
+        predicate = _compile(expression, ignore_case)
+    except (LexerError, ParserError, EvaluationError):
+        logger.error(
+            "DSL expression failed evaluation or parsing.",
+            exc_info=True,
+            extra={'expression': expression}
+        )
+        return [None] * len(texts)
+
+    if ignore_case:
+        return [predicate(text.lower() if text else text) for text in texts]
+    return [predicate(text) for text in texts]
@@ -0,0 +1,64 @@
+# infrastructure/dsl/codegen.py
+
+from typing import Any, Callable, Dict, List
+from .ast_nodes import (
+    ASTNode, WordNode, QuotedStringNode,
+    AndNode, OrNode, NotNode, BeforeNode
+)
+from .compiler import _is_plain_literal, reorder_by_cost
+from .evaluator import Evaluator
+from .exceptions import EvaluationError
+
+
+Predicate = Callable[[str], bool]
+
+
+def compile_predicate(node: ASTNode) -> Predicate:
+    """
+    Generate a plain Python function equivalent to evaluating `node`.
+
+    The expression becomes straight-line Python (`in`, `and`, `or`, `not`,
+    `str.find`), so a match is a single function call with Python's own
+    short-circuiting. Literals are embedded with repr(), never as code.
+
+    Raises SyntaxError/RecursionError when the expression nests deeper than
+    the Python compiler accepts; callers fall back to the tree-walking evaluator.
+    """
+    nodes: List[ASTNode] = []
+    body = emit(reorder_by_cost(node), nodes)
+    source = f"def _predicate(t):\n    return bool(t) and {body}\n"
+
+    namespace: Dict[str, Any] = {"_before": Evaluator().check_before, "_nodes": tuple(nodes)}
+    exec(compile(source, "<dsl>", "exec"), namespace)
+    return namespace["_predicate"]
+
+
+def emit(node: ASTNode, nodes: List[ASTNode]) -> str:
+    """
+    Python expression text for `node`, in terms of the text variable `t`.
+
+    BeforeNodes that cannot be written inline are appended to `nodes` and
+    evaluated through the positional search.
+    """
+    if isinstance(node, (WordNode, QuotedStringNode)):
+        return f"({node.value!r} in t)"
+
+    elif isinstance(node, AndNode):
+        return f"({emit(node.left, nodes)} and {emit(node.right, nodes)})"
+
+    elif isinstance(node, OrNode):
+        return f"({emit(node.left, nodes)} or {emit(node.right, nodes)})"
+
+    elif isinstance(node, NotNode):
+        return f"(not {emit(node.operand, nodes)})"
+
+    elif isinstance(node, BeforeNode):
+        left, right = node.left, node.right
+        if _is_plain_literal(left) and _is_plain_literal(right):
+            # First `left` found, and the last `right` starts after it
+            return f"(-1 < t.find({left.value!r}) < t.rfind({right.value!r}))"
+        nodes.append(node)
+        return f"_before(_nodes[{len(nodes) - 1}], t)"
+
+    else:
+        raise EvaluationError(f"Unknown node type: {type(node).__name__}")
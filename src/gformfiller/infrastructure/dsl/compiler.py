@@ -0,0 +1,52 @@
+# infrastructure/dsl/compiler.py
+
+from typing import Tuple, TypeGuard, Union
+from .ast_nodes import (
+    ASTNode, WordNode, QuotedStringNode,
+    AndNode, OrNode, NotNode, BeforeNode
+)
+
+
+def estimate_cost(node: ASTNode) -> int:
+    """
+    Rough static cost of evaluating `node` against a text.
+
+    A literal is one substring scan; BEFORE does positional searches on both
+    sides and is weighted double.
+    """
+    return _reorder(node)[1]
+
+
+def reorder_by_cost(node: ASTNode) -> ASTNode:
+    """
+    Return an equivalent tree where every AND/OR evaluates its cheaper
+    operand first, so short-circuiting skips the expensive side more often.
+
+    AND and OR are commutative; BEFORE is not, so its operands keep their
+    order (their own subtrees are still reordered). The input tree is left
+    untouched since cached ASTs may be shared.
+    """
+    return _reorder(node)[0]
+
+
+def _reorder(node: ASTNode) -> Tuple[ASTNode, int]:
+    """Reordered copy of `node` with its cost, each subtree's cost computed once."""
+    if isinstance(node, (AndNode, OrNode)):
+        left, left_cost = _reorder(node.left)
+        right, right_cost = _reorder(node.right)
+        if right_cost < left_cost:
+            left, right = right, left
+        return type(node)(left=left, right=right), left_cost + right_cost
+    if isinstance(node, BeforeNode):
+        left, left_cost = _reorder(node.left)
+        right, right_cost = _reorder(node.right)
+        return BeforeNode(left=left, right=right), 2 * (left_cost + right_cost)
+    if isinstance(node, NotNode):
+        operand, cost = _reorder(node.operand)
+        return NotNode(operand=operand), cost
+    return node, 1
+
+
+def _is_plain_literal(node: ASTNode) -> TypeGuard[Union[WordNode, QuotedStringNode]]:
+    """Non-empty literal (an empty one matches everywhere, even past the end)."""
+    return isinstance(node, (WordNode, QuotedStringNode)) and bool(node.value)
@@ -21,6 +21,13 @@ class Evaluator:
             return False
         return self._visit(node, text)
 
+    def check_before(self, node: BeforeNode, text: str) -> bool:
+        """
+        Evaluate a single BeforeNode against a non-empty text.
+        Used by generated predicates for BEFORE operands that are not plain literals.
+        """
+        return self._visit_before(node, text)
+
     def _visit(self, node: ASTNode, text: str) -> bool:
         """Dispatch based on node type."""
         
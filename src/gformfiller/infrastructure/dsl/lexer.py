@@ -1,10 +1,22 @@
 # infrastructure/dsl/lexer.py
 
-from typing import List, Optional
+import re
+from typing import List
 from .tokens import Token, TokenType
 from .exceptions import LexerError
 
 
+def _keep_escaped(m: re.Match) -> str:
+    """Escaped character taken literally"""
+    return m.group(1)
+
+
+def _resolve_quoted_escape(m: re.Match) -> str:
+    """Escaped character in a quoted string: control character or literal"""
+    char = m.group(1)
+    return Lexer._QUOTED_ESCAPES.get(char, char)
+
+
 class Lexer:
     r"""
     Tokenize DSL expressions with escape character support
@@ -19,11 +31,42 @@ class Lexer:
         \)    -> )
         \     -> (space)
     """
+
+    # Leading whitespace is swallowed by each match; trailing whitespace
+    # matches nothing and is skipped by finditer.
+    _TOKEN_RE = re.compile(r"""
+      \s*(?:
+        (?P<AND>&)
+      | (?P<OR>\|)
+      | (?P<NOT>~)
+      | (?P<BEFORE><)
+      | (?P<LPAREN>\()
+      | (?P<RPAREN>\))
+      | (?P<QUOTED>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')
+      | (?P<UNTERMINATED>["'])
+        # A word may contain quotes, just not start with one; a backslash
+        # escapes the next character (and is left dangling only at the end)
+      | (?P<WORD>(?:\\.?|[^\s&|~<()"'\\])(?:\\.?|[^\s&|~<()\\])*)
+      )
+    """, re.VERBOSE | re.DOTALL)
+
+    _OPERATORS = {
+        'AND': TokenType.AND,
+        'OR': TokenType.OR,
+        'NOT': TokenType.NOT,
+        'BEFORE': TokenType.BEFORE,
+        'LPAREN': TokenType.LPAREN,
+        'RPAREN': TokenType.RPAREN,
+    }
+
+    # Compiled once with the class, shared by every Lexer instance
+    _ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+
+    _QUOTED_ESCAPES = {'n': '\n', 't': '\t'}
     
     def __init__(self, input_text: str):
         self.input = input_text
         self.position = 0
-        self.current_char: Optional[str] = input_text[0] if input_text else None
     
     def error(self, message: str) -> LexerError:
         """Raise lexer error with position"""
@@ -41,194 +84,85 @@ class Lexer:
         pointer = " " * (self.position - start) + "^"
         return f"{context}\n{pointer}"
     
-    def advance(self) -> None:
-        """Move to next character"""
-        self.position += 1
-        if self.position >= len(self.input):
-            self.current_char = None
-        else:
-            self.current_char = self.input[self.position]
-    
-    def peek(self, offset: int = 1) -> Optional[str]:
-        """Look ahead without advancing"""
-        peek_pos = self.position + offset
-        if peek_pos >= len(self.input):
-            return None
-        return self.input[peek_pos]
-    
-    def skip_whitespace(self) -> None:
-        """Skip whitespace characters"""
-        while self.current_char is not None and self.current_char.isspace():
-            self.advance()
-    
-    def read_word(self) -> Token:
-        r"""
-        Read a word, handling escape sequences
-        
-        A word is a sequence of characters that can include:
-        - Letters, digits, underscores
-        - Escaped special characters (\\, \&, \|, etc.)
-        - Escaped spaces (\ )
-        
-        Examples:
-            abc          -> "abc"
-            user\&admin  -> "user&admin"
-            first\ name  -> "first name"
-            path\\file   -> "path\file"
-        """
-        start_pos = self.position
-        result = []
-        
-        while self.current_char is not None:
-            # Handle escape sequences
-            if self.current_char == '\\':
-                self.advance()  # Skip backslash
-                
-                if self.current_char is None:
-                    raise self.error("Unexpected end of input after backslash")
-                
-                # Add the escaped character literally
-                result.append(self.current_char)
-                self.advance()
-            
-            # Stop at unescaped special characters
-            elif self.current_char in '&|~<()':
-                break
-            
-            # Stop at unescaped whitespace
-            elif self.current_char.isspace():
-                break
-            
-            # Regular character
-            else:
-                result.append(self.current_char)
-                self.advance()
-        
-        if not result:
-            raise self.error("Expected word")
-        
-        word = ''.join(result)
-        length = self.position - start_pos
-        
-        return Token(
-            type=TokenType.WORD,
-            value=word,
-            position=start_pos,
-            length=length
-        )
-    
-    def read_quoted_string(self, quote_char: str) -> Token:
-        """
-        Read a quoted string (single or double quotes)
-        
-        Examples:
-            "hello world"  -> "hello world"
-            'user&admin'   -> "user&admin"
-            "she said \"hi\""  -> "she said "hi""
-        """
-        start_pos = self.position
-        self.advance()  # Skip opening quote
-        
-        result = []
-        
-        while self.current_char is not None:
-            # Handle escape sequences in quoted strings
-            if self.current_char == '\\':
-                self.advance()
-                
-                if self.current_char is None:
-                    raise self.error("Unexpected end of input in quoted string")
-                
-                # Handle common escape sequences
-                if self.current_char == 'n':
-                    result.append('\n')
-                elif self.current_char == 't':
-                    result.append('\t')
-                elif self.current_char == '\\':
-                    result.append('\\')
-                elif self.current_char == quote_char:
-                    result.append(quote_char)
-                else:
-                    # Unknown escape - include literally
-                    result.append(self.current_char)
-                
-                self.advance()
-            
-            # End of quoted string
-            elif self.current_char == quote_char:
-                self.advance()  # Skip closing quote
-                break
-            
-            # Regular character in quoted string
-            else:
-                result.append(self.current_char)
-                self.advance()
-        else:
-            raise self.error(f"Unterminated quoted string (expected {quote_char})")
-        
-        string_value = ''.join(result)
-        length = self.position - start_pos
-        
-        return Token(
-            type=TokenType.QUOTED_STRING,
-            value=string_value,
-            position=start_pos,
-            length=length
-        )
-    
     def tokenize(self) -> List[Token]:
         """
         Tokenize the entire input
         
+        A single combined regex splits the input; every character other than
+        whitespace belongs to exactly one alternative, so `finditer` never
+        skips anything significant.
+
         Returns:
             List of tokens
             
         Raises:
             LexerError: If invalid syntax is encountered
         """
-        tokens = []
-        
-        while self.current_char is not None:
-            # Skip whitespace
-            if self.current_char.isspace():
-                self.skip_whitespace()
-                continue
-            
-            # Single character operators
-            if self.current_char == '&':
-                tokens.append(Token(TokenType.AND, '&', self.position, 1))
-                self.advance()
-            
-            elif self.current_char == '|':
-                tokens.append(Token(TokenType.OR, '|', self.position, 1))
-                self.advance()
-            
-            elif self.current_char == '~':
-                tokens.append(Token(TokenType.NOT, '~', self.position, 1))
-                self.advance()
-            
-            elif self.current_char == '<':
-                tokens.append(Token(TokenType.BEFORE, '<', self.position, 1))
-                self.advance()
-            
-            elif self.current_char == '(':
-                tokens.append(Token(TokenType.LPAREN, '(', self.position, 1))
-                self.advance()
-            
-            elif self.current_char == ')':
-                tokens.append(Token(TokenType.RPAREN, ')', self.position, 1))
-                self.advance()
-            
-            # Quoted strings
-            elif self.current_char in ('"', "'"):
-                quote_char = self.current_char
-                tokens.append(self.read_quoted_string(quote_char))
-            
-            # Words (including escaped characters)
+        tokens: List[Token] = []
+        append = tokens.append
+        text = self.input
+        operators = self._OPERATORS
+        WORD = TokenType.WORD
+        QUOTED_STRING = TokenType.QUOTED_STRING
+
+        for m in self._TOKEN_RE.finditer(text):
+            kind = m.lastgroup
+            assert kind is not None  # every alternative is a named group
+            raw = m.group(kind)
+            start = m.start(kind)
+
+            if kind == 'WORD':
+                append(Token(WORD, self._unescape_word(raw, m.end()), start, len(raw)))
+
+            elif kind == 'QUOTED':
+                append(Token(QUOTED_STRING, self._unescape_quoted(raw[1:-1]), start, len(raw)))
+
+            elif kind == 'UNTERMINATED':
+                # No closing quote follows, so the string runs to the end of input
+                self.position = len(text)
+                rest = text[m.end():]
+                if (len(rest) - len(rest.rstrip('\\'))) % 2:
+                    raise self.error("Unexpected end of input in quoted string")
+                raise self.error(f"Unterminated quoted string (expected {raw})")
+
             else:
-                tokens.append(self.read_word())
-        
+                append(Token(operators[kind], raw, start, 1))
+
+        self.position = len(text)
+
         # Add EOF token
-        tokens.append(Token(TokenType.EOF, None, self.position, 0))
+        append(Token(TokenType.EOF, None, self.position, 0))
         
-        return tokens
\ No newline at end of file
+        return tokens
+
+    def _unescape_word(self, raw: str, end: int) -> str:
+        r"""
+        Resolve escapes in a word: a backslash keeps the next character literally
+
+        Examples:
+            abc          -> "abc"
+            user\&admin  -> "user&admin"
+            first\ name  -> "first name"
+            path\\file   -> "path\file"
+        """
+        if '\\' not in raw:
+            return raw
+
+        # An odd run of trailing backslashes leaves the last one without a character
+        trailing = len(raw) - len(raw.rstrip('\\'))
+        if trailing % 2 and end == len(self.input):
+            self.position = end
+            raise self.error("Unexpected end of input after backslash")
+
+        return self._ESCAPE_RE.sub(_keep_escaped, raw)
+
+    def _unescape_quoted(self, body: str) -> str:
+        r"""
+        Resolve escapes inside a quoted string: \n and \t are control
+        characters, any other escaped character (quote, backslash...) is kept
+        literally.
+        """
+        if '\\' not in body:
+            return body
+
+        return self._ESCAPE_RE.sub(_resolve_quoted_escape, body)
@@ -9,15 +9,32 @@ from .ast_nodes import (
 from .exceptions import ParserError
 
 
+# Binary operators: precedence (higher binds tighter) and the node they build.
+# All of them are left-associative.
+PRECEDENCE = {
+    TokenType.OR: 1,
+    TokenType.AND: 2,
+    TokenType.BEFORE: 3,
+}
+BINARY_NODES = {
+    TokenType.OR: OrNode,
+    TokenType.AND: AndNode,
+    TokenType.BEFORE: BeforeNode,
+}
+
+
 class Parser:
     """
-    Recursive Descent Parser for the DSL.
+    Precedence-climbing Parser for the DSL.
     
     Grammar Hierarchy (Precedence from low to high):
     1. Expression (OR)
     2. AndTerm (AND)
     3. BeforeTerm (BEFORE)
     4. Factor (NOT, parens, literals)
+
+    Levels 1-3 are handled by a single loop driven by PRECEDENCE instead of
+    one method per level.
     """
 
     def __init__(self, tokens: List[Token]):
@@ -64,41 +81,24 @@ class Parser:
 
     # --- Grammar Rules ---
 
-    def expression(self) -> ASTNode:
+    def expression(self, min_prec: int = 1) -> ASTNode:
         """
-        expression : and_term (OR and_term)*
-        """
-        node = self.and_term()
-
-        while self.current_token.type == TokenType.OR:
-            self.eat(TokenType.OR)
-            node = OrNode(left=node, right=self.and_term())
+        expression : factor (binop expression)*
 
-        return node
-
-    def and_term(self) -> ASTNode:
-        """
-        and_term : before_term (AND before_term)*
-        """
-        node = self.before_term()
-
-        while self.current_token.type == TokenType.AND:
-            self.eat(TokenType.AND)
-            node = AndNode(left=node, right=self.before_term())
-
-        return node
-
-    def before_term(self) -> ASTNode:
-        """
-        before_term : factor (BEFORE factor)*
+        Only operators binding at least as tight as `min_prec` are consumed
+        here; the right operand is parsed one level tighter, which makes
+        every operator left-associative.
         """
         node = self.factor()
 
-        while self.current_token.type == TokenType.BEFORE:
-            self.eat(TokenType.BEFORE)
-            node = BeforeNode(left=node, right=self.factor())
+        while True:
+            op_type = self.current_token.type
+            prec = PRECEDENCE.get(op_type)
+            if prec is None or prec < min_prec:
+                return node
 
-        return node
+            self.advance()
+            node = BINARY_NODES[op_type](left=node, right=self.expression(prec + 1))
 
     def factor(self) -> ASTNode:
         """
@@ -106,13 +106,13 @@ class Parser:
                | LPAREN expression RPAREN
                | atom
         """
-        token = self.current_token
+        token_type = self.current_token.type
 
-        if token.type == TokenType.NOT:
+        if token_type == TokenType.NOT:
             self.eat(TokenType.NOT)
             return NotNode(operand=self.factor())
 
-        elif token.type == TokenType.LPAREN:
+        elif token_type == TokenType.LPAREN:
             self.eat(TokenType.LPAREN)
             node = self.expression()
             self.eat(TokenType.RPAREN)
@@ -126,18 +126,19 @@ class Parser:
         atom : WORD | QUOTED_STRING
         """
         token = self.current_token
+        token_type = token.type
 
-        if token.type == TokenType.WORD:
+        if token_type == TokenType.WORD:
             self.eat(TokenType.WORD)
             return WordNode(value=token.value)
         
-        elif token.type == TokenType.ESCAPED_WORD:
+        elif token_type == TokenType.ESCAPED_WORD:
             self.eat(TokenType.ESCAPED_WORD)
             return WordNode(value=token.value)
 
-        elif token.type == TokenType.QUOTED_STRING:
+        elif token_type == TokenType.QUOTED_STRING:
             self.eat(TokenType.QUOTED_STRING)
             return QuotedStringNode(value=token.value)
 
         else:
-            raise self.error(f"Unexpected token in atom: {token.type}")
\ No newline at end of file
+            raise self.error(f"Unexpected token in atom: {token_type.name}")
\ No newline at end of file
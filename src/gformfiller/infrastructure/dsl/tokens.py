@@ -1,12 +1,12 @@
 # infrastructure/dsl/tokens.py
 
-from enum import Enum, auto
+from enum import IntEnum, auto
 from dataclasses import dataclass
 from typing import Any
 
 
-class TokenType(Enum):
-    """Token types for DSL"""
+class TokenType(IntEnum):
+    """Token types for DSL (int-valued: comparisons and dict lookups stay cheap)"""
     
     # Literals
     WORD = auto()              # Simple word: abc
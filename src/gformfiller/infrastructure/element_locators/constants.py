@@ -1,7 +1,9 @@
 # gformfiller/infrastructure/element_locators/constants.py
 
 from enum import Enum, auto
-from typing import NamedTuple
+from typing import Dict, NamedTuple, Tuple
+
+from selenium.webdriver.common.by import By
 
 # 1. Enumeration of Localization Strategies
 class LocalizationStrategy(Enum):
@@ -188,4 +190,26 @@ class GoogleFormElement(Enum):
     ANY = Element(
         type=ElementType.ANY,
         xpath=".//div"
-    )
\ No newline at end of file
+    )
+
+
+# 5. Precomputed Selenium locators
+# Selenium's `By` value for each strategy
+STRATEGY_TO_BY: Dict[LocalizationStrategy, str] = {
+    LocalizationStrategy.XPATH: By.XPATH,
+    LocalizationStrategy.CSS_LOCATOR: By.CSS_SELECTOR,
+}
+
+def _selector_for(element: Element, strategy: LocalizationStrategy) -> str:
+    if strategy == LocalizationStrategy.XPATH:
+        return element.xpath
+    return element.css_selector
+
+# Ready-to-use (By, selector) arguments for find_element(s), built once.
+# Pairs whose selector is empty for the strategy are left out.
+LOCATORS: Dict[Tuple[GoogleFormElement, LocalizationStrategy], Tuple[str, str]] = {
+    (form_element, strategy): (by, _selector_for(form_element.value, strategy))
+    for form_element in GoogleFormElement
+    for strategy, by in STRATEGY_TO_BY.items()
+    if _selector_for(form_element.value, strategy)
+}
@@ -2,10 +2,9 @@
 
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.common.by import By
 from typing import Union
 
-from .constants import Element, LocalizationStrategy, GoogleFormElement
+from .constants import LOCATORS, STRATEGY_TO_BY, LocalizationStrategy, GoogleFormElement
 from .exceptions import InvalidStrategyError, ElementNotFoundError
 
 class ElementLocator:
@@ -28,25 +27,12 @@ class ElementLocator:
         self._context = context
         self._strategy = strategy
 
-    def _get_selenium_by_strategy(self) -> str:
-        """Converts the internal strategy to Selenium's By object."""
-        if self._strategy == LocalizationStrategy.XPATH:
-            return By.XPATH
-        elif self._strategy == LocalizationStrategy.CSS_LOCATOR:
-            return By.CSS_SELECTOR
-        else:
+    def _check_strategy(self) -> None:
+        """Raise InvalidStrategyError if the current strategy has no Selenium `By`."""
+        if self._strategy not in STRATEGY_TO_BY:
             # This error should not occur if constants are well-defined
             raise InvalidStrategyError(self._strategy.value)
 
-    def _get_selector_value(self, element: Element) -> str:
-        """Retrieves the selector value based on the current strategy."""
-        if self._strategy == LocalizationStrategy.XPATH:
-            return element.xpath
-        elif self._strategy == LocalizationStrategy.CSS_LOCATOR:
-            return element.css_selector
-        else:
-            raise InvalidStrategyError(self._strategy.value)
-
     def locate(self, element_enum: GoogleFormElement) -> WebElement:
         """
         Locates and returns the first WebElement corresponding to the given element
@@ -56,22 +42,21 @@ class ElementLocator:
         :return: The found WebElement.
         :raises ElementNotFoundError: If the element is not found within the context.
         """
-        element: Element = element_enum.value
-        by_strategy = self._get_selenium_by_strategy()
-        selector = self._get_selector_value(element)
+        locator = LOCATORS.get((element_enum, self._strategy))
 
-        if not selector:
+        if locator is None:
             # If the selector is empty for the chosen strategy
-            raise ElementNotFoundError(element.type.name, self._strategy.name)
+            self._check_strategy()
+            raise ElementNotFoundError(element_enum.value.type.name, self._strategy.name)
 
         try:
             # Use find_element (singular) to find the first element
             # The context can be a WebDriver or a WebElement
-            return self._context.find_element(by_strategy, selector)
+            return self._context.find_element(*locator)
         except Exception as e:
             # Selenium typically raises NoSuchElementException
             raise ElementNotFoundError(
-                element.type.name,
+                element_enum.value.type.name,
                 self._strategy.name
             ) from e
 
@@ -82,15 +67,14 @@ class ElementLocator:
         :param element_enum: An instance of GoogleFormElement.
         :return: A list of found WebElements (can be empty).
         """
-        element: Element = element_enum.value
-        by_strategy = self._get_selenium_by_strategy()
-        selector = self._get_selector_value(element)
+        locator = LOCATORS.get((element_enum, self._strategy))
 
-        if not selector:
+        if locator is None:
+            self._check_strategy()
             return []
 
         # Use find_elements (plural)
-        return self._context.find_elements(by_strategy, selector)
+        return self._context.find_elements(*locator)
 
     def set_strategy(self, strategy: LocalizationStrategy):
         """Changes the localization strategy."""
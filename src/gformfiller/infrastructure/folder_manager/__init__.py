@@ -1,6 +1,6 @@
 # gformfiller/infrastructure/folder_manager/__init__.py
 
-from .manager import FolderManager
+from .manager import FolderManager, get_folder_manager
 from .constants import (
     ROOT_DIR,
 
@@ -1,16 +1,33 @@
 # gformfiller/infrastructure/folder_manager/db_logger.py
 
+import atexit
+import logging
+import queue
 import sqlite3
+import threading
+import time
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+INSERT_LOG_SQL = "INSERT INTO system_logs (timestamp, action, category, target, details) VALUES (?, ?, ?, ?, ?)"
 
 class ActionLogger:
     def __init__(self, db_path: Path):
         self.db_path = db_path
+        # One connection for the logger's lifetime, shared across threads
+        self._conn = connect_db(db_path)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
         self._init_db()
 
     def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
+            # WAL lets the background writer append while readers fetch logs
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS system_logs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -21,26 +38,144 @@ class ActionLogger:
                     details TEXT
                 )
             """)
-            conn.commit()
 
     def log(self, action: str, category: str, target: str, details: str = ""):
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             conn.execute(
-                "INSERT INTO system_logs (timestamp, action, category, target, details) VALUES (?, ?, ?, ?, ?)",
+                INSERT_LOG_SQL,
                 (datetime.now().isoformat(), action, category, target, details)
             )
-            conn.commit()
 
     def get_logs(self, limit: int = 100):
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            "SELECT id, timestamp, action, category, target, details FROM system_logs ORDER BY id DESC LIMIT ?", 
-            (limit,)
-        )
-        rows = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT id, timestamp, action, category, target, details FROM system_logs ORDER BY id DESC LIMIT ?", 
+                (limit,)
+            )
+            rows = cursor.fetchall()
         
-        return [dict(row) for row in rows]
\ No newline at end of file
+        return [dict(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def connect_db(db_path: Path) -> sqlite3.Connection:
+    """
+    Open an application SQLite database.
+    The connection may be long-lived and shared; callers serialize access themselves.
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    # Safe under WAL and avoids an fsync on every commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class LogWorker:
+    """
+    Background writer for action logs.
+
+    Rows are queued by `submit` and committed by a daemon thread in batches
+    (every `FLUSH_INTERVAL` seconds or `BATCH_SIZE` rows), one transaction
+    per database, so callers never wait on SQLite.
+    """
+    BATCH_SIZE = 100
+    FLUSH_INTERVAL = 0.05
+    # Longest a flush waits for the writer before giving up
+    FLUSH_TIMEOUT = 5.0
+
+    _STOP = object()
+
+    def __init__(self):
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Connections by database, only used by whoever runs _write
+        self._conns: Dict[Path, sqlite3.Connection] = {}
+        self._thread = threading.Thread(target=self._run, name="action-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def submit(self, db_path: Path, action: str, category: str, target: str, details: str = ""):
+        row = (datetime.now().isoformat(), action, category, target, details)
+        if self._thread.is_alive():
+            self._queue.put((db_path, row))
+        else:
+            self._write([(db_path, row)])
+            self._close_connections()
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT) -> bool:
+        """
+        Block until every row submitted so far has been committed.
+        Returns False if the writer did not get there within `timeout` seconds.
+        """
+        if not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        if done.wait(timeout):
+            return True
+        logger.warning(f"Action log writer did not flush within {timeout}s")
+        return False
+
+    def stop(self):
+        """Commit pending rows and stop the writer thread."""
+        atexit.unregister(self.stop)
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+        self._close_connections()
+
+    def _close_connections(self):
+        for conn in self._conns.values():
+            conn.close()
+        self._conns.clear()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch: List[Tuple[Path, tuple]] = []
+            waiters: List[threading.Event] = []
+
+            item = self._queue.get()
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            while True:
+                if item is self._STOP:
+                    stopping = True
+                    break
+                if isinstance(item, threading.Event):
+                    # Flush request: commit what we have right away
+                    waiters.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.BATCH_SIZE:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            self._write(batch)
+            for waiter in waiters:
+                waiter.set()
+
+    def _write(self, batch: List[Tuple[Path, tuple]]):
+        rows_by_db: Dict[Path, List[tuple]] = defaultdict(list)
+        for db_path, row in batch:
+            rows_by_db[db_path].append(row)
+
+        for db_path, rows in rows_by_db.items():
+            try:
+                conn = self._conns.get(db_path)
+                if conn is None:
+                    conn = self._conns[db_path] = connect_db(db_path)
+                with conn:
+                    conn.executemany(INSERT_LOG_SQL, rows)
+            except sqlite3.Error as e:
+                # Reconnect on the next batch rather than reuse a broken handle
+                stale = self._conns.pop(db_path, None)
+                if stale is not None:
+                    stale.close()
+                logger.error(f"Failed to write {len(rows)} log rows to {db_path}: {e}")
@@ -1,18 +1,41 @@
 import os
+import copy
+import functools
 import shutil
-import json
 import sqlite3
 import logging
-from pathlib import Path
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import IO, List, Dict, Any, Iterator, Optional, Set, Tuple
 
-from .db_logger import ActionLogger
+import orjson
+
+from .db_logger import ActionLogger, LogWorker
 from .constants import *
 
 logger = logging.getLogger(__name__)
 
+# Static path keys and fragments used by get_filler_paths
+_RECORD_PDFS_KEY = f"{RECORD_SUBDIR}_{PDFS_SUBDIR}"
+_RECORD_SCR_KEY = f"{RECORD_SUBDIR}_{SCREENSHOTS_SUBDIR}"
+_REL_RECORD_PDFS = PurePosixPath(RECORD_SUBDIR, PDFS_SUBDIR)
+_REL_RECORD_SCR = PurePosixPath(RECORD_SUBDIR, SCREENSHOTS_SUBDIR)
+
+_KEY_TO_FILE = {
+    FileKeys.FORMDATA: FORMDATA_FILE,
+    FileKeys.CONFIG: CONFIG_FILE,
+    FileKeys.METADATA: METADATA_FILE
+}
+
 class FolderManager:
+    _FILLER_DIR_KEYS = (FILES_SUBDIR, _RECORD_PDFS_KEY, _RECORD_SCR_KEY)
+    # How long (in seconds) a missing filler is remembered as missing
+    _NEG_CACHE_TTL = 2.0
+
     def __init__(self, root_path = Path.home() / ROOT_DIR):
         self.root = root_path
 
@@ -25,9 +48,37 @@ class FolderManager:
         self.users_db = self.root / USERS_DB
         self.default_config = self.root / DEFAULT_CONFIG
 
+        # Pending content of JSON files inside buffered() blocks, keyed by
+        # (user_id, filler_name, filename); entries are dropped once written
+        self._json_cache: Dict[Tuple[str, str, str], Any] = {}
+        self._json_buffered: Set[Tuple[str, str, str]] = set()
+        self._json_dirty: Set[Tuple[str, str, str]] = set()
+        self._json_lock = threading.RLock()
+        # Parsed JSON by path, valid while (mtime_ns, size, inode) is unchanged
+        self._json_parse_cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+
+        # Negative-lookup cache: (user_id, filler_name) -> expiry (monotonic time)
+        self._neg_cache: Dict[Tuple[str, str], float] = {}
+
+        # One ActionLogger per user, built on first use
+        self._action_loggers: Dict[str, ActionLogger] = {}
+        # Action log rows are committed in the background
+        self._log_worker = LogWorker()
+
+        # Shared pool for concurrent file reads across fillers
+        self._io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="fm-io")
+
         # Ensure system dirs
         self._ensure_system_dirs()
 
+    def close(self):
+        """Release background resources held by the manager."""
+        self._log_worker.stop()
+        self._io_pool.shutdown(wait=True)
+        for db_logger in self._action_loggers.values():
+            db_logger.close()
+        self._action_loggers.clear()
+
     def _ensure_system_dirs(self):
         """Create core application directories."""
         for d in [self.users_dir, self.profiles_dir]:
@@ -74,42 +125,69 @@ class FolderManager:
             "root": base,
             FILES_SUBDIR: base / FILES_SUBDIR,
             RECORD_SUBDIR: base / RECORD_SUBDIR,
-            f"{RECORD_SUBDIR}_{PDFS_SUBDIR}": base / RECORD_SUBDIR / PDFS_SUBDIR,
-            f"{RECORD_SUBDIR}_{SCREENSHOTS_SUBDIR}": base / RECORD_SUBDIR / SCREENSHOTS_SUBDIR,
+            _RECORD_PDFS_KEY: base / _REL_RECORD_PDFS,
+            _RECORD_SCR_KEY: base / _REL_RECORD_SCR,
             FILLER_LOG_FILE: base / FILLER_LOG_FILE,
             FORMDATA_FILE: base / FORMDATA_FILE,
             CONFIG_FILE: base / CONFIG_FILE,
             METADATA_FILE: base / METADATA_FILE
         }
 
-    def init_filler_structure(self, user_id: str, filler_name: str):
+    def init_filler_structure(self, user_id: str, filler_name: str) -> Dict[str, Path]:
         """Create the complete directory tree for a new filler."""
         paths = self.get_filler_paths(user_id, filler_name)
-        for p in paths.values():
-            if isinstance(p, Path) and not p.suffix: # Don't create folders for DB files
-                p.mkdir(parents=True, exist_ok=True)
+        self._neg_cache.pop((user_id, filler_name), None)
+        # Leaf directories only: parents (root, record/) are created along the way
+        for key in self._FILLER_DIR_KEYS:
+            paths[key].mkdir(parents=True, exist_ok=True)
         logger.info(f"Structure initialized for filler '{filler_name}' (User: {user_id})")
+        return paths
+
+    def _filler_missing(self, user_id: str, filler_name: str) -> bool:
+        """
+        Check whether a filler does not exist, remembering misses for a short
+        while so that repeated polls skip the filesystem entirely.
+        """
+        key = (user_id, filler_name)
+        now = time.monotonic()
+        expiry = self._neg_cache.get(key)
+        if expiry is not None and now < expiry:
+            return True
+
+        if (self.users_dir / user_id / FILLERS_SUBDIR / filler_name).exists():
+            self._neg_cache.pop(key, None)
+            return False
+
+        self._neg_cache[key] = now + self._NEG_CACHE_TTL
+        return True
 
     def get_log_db(self, user_id) -> Path:
         return self.get_user_paths(user_id)[LOG_DB]
 
     def get_db_logger(self, user_id) -> ActionLogger:
-        log_db = self.get_log_db(user_id)
-        return ActionLogger(log_db)
+        # Make sure queued actions are visible to whoever reads the logs
+        self._log_worker.flush()
+        return self._get_action_logger(user_id)
+
+    def _get_action_logger(self, user_id: str) -> ActionLogger:
+        db_logger = self._action_loggers.get(user_id)
+        if db_logger is None:
+            db_logger = ActionLogger(self.get_log_db(user_id))
+            self._action_loggers[user_id] = db_logger
+        return db_logger
 
     def _make_db_log(
             self, user_id: str, action: str, category: str, target: str, details: str = ""
     ):
-        self.get_db_logger(user_id).log(action, category, target, details)
+        db_logger = self._get_action_logger(user_id)
+        self._log_worker.submit(db_logger.db_path, action, category, target, details)
 
     def create_filler(self, user_id: str, filler_name: str):
         """Create the complete directory tree for a new filler and init root files."""
         # 1. Create the complete directory tree
-        filler_paths = self.get_filler_paths(user_id, filler_name)
-        for p in filler_paths.values():
-            if isinstance(p, Path) and not p.suffix: # Don't create folders for files
-                p.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Structure initialized for filler '{filler_name}' (User: {user_id})")
+        filler_paths = self.init_filler_structure(user_id, filler_name)
+        # A filler removed outside delete_filler may still have cached content
+        self._invalidate_json_cache(user_id, filler_name)
 
         # 2. Init root files
         self._write_json(filler_paths[FORMDATA_FILE], {})
@@ -132,6 +210,10 @@ class FolderManager:
 
         if filler_root.exists():
             shutil.rmtree(filler_root)
+            self._invalidate_json_cache(user_id, filler_name)
+            prefix = str(filler_root) + os.sep
+            for key in [k for k in self._json_parse_cache if k.startswith(prefix)]:
+                self._json_parse_cache.pop(key, None)
             self._make_db_log(user_id, "CREATE", "FILLER", filler_name)
 
     # --- JSON CONTENT (formdata, config, metadata) ---
@@ -145,7 +227,13 @@ class FolderManager:
             self.create_filler(user_id, filler_name)
 
         path = filler_root / filename
-        return self._read_json(path)
+        key = (user_id, filler_name, filename)
+        with self._json_lock:
+            if key in self._json_cache:
+                # Unwritten update from a buffered() block; callers may mutate the copy
+                return copy.deepcopy(self._json_cache[key])
+        # Parsed straight from disk, so changes made by other processes are seen
+        return self._read_json(path, fresh=True)
 
     def update_filler_file_content(
             self, user_id: str, filler_name: str, file_key: str, data: Any, partial: bool = True
@@ -154,14 +242,25 @@ class FolderManager:
         filler_paths = self.get_filler_paths(user_id, filler_name)
         fille_root = filler_paths["root"]
         path = fille_root / filename
-        
-        if partial and path.exists():
-            current = self._read_json(path)
-            if isinstance(current, dict) and isinstance(data, dict):
-                current.update(data)
-                data = current
-        
-        self._write_json(path, data)
+        key = (user_id, filler_name, filename)
+
+        with self._json_lock:
+            if partial:
+                if key in self._json_cache:
+                    current = self._json_cache[key]
+                else:
+                    # Checked against the file's signature, so never older than the disk
+                    current = self._read_json(path)
+                if isinstance(current, dict) and isinstance(data, dict):
+                    # Merge into a new dict: `current` may be shared with the parse cache
+                    data = {**current, **data}
+
+            if key in self._json_buffered:
+                self._json_cache[key] = copy.deepcopy(data)
+                self._json_dirty.add(key)
+            else:
+                self._write_json(path, data)
+
         self._make_db_log(user_id, "UPDATE", f"FILLER_{file_key.upper()}", filler_name)
 
     def delete_filler_file_content(self, user_id: str, filler_name: str, file_key: str):
@@ -169,12 +268,56 @@ class FolderManager:
         filler_paths = self.get_filler_paths(user_id, filler_name)
         fille_root = filler_paths["root"]
         path = fille_root / filename
-        self._write_json(path, {})
+        with self._json_lock:
+            self._invalidate_json_cache(user_id, filler_name, filename)
+            self._write_json(path, {})
         self._make_db_log(user_id, "RESET", f"FILLER_{file_key.upper()}", filler_name)
 
+    def flush(self, user_id: str, filler_name: str, file_key: str):
+        """Write a buffered JSON file to disk if it has pending updates."""
+        filename = self._map_key_to_file(file_key)
+        key = (user_id, filler_name, filename)
+        with self._json_lock:
+            if key not in self._json_dirty:
+                return
+            path = self.get_filler_paths(user_id, filler_name)["root"] / filename
+            self._write_json(path, self._json_cache[key])
+            self._json_dirty.discard(key)
+            del self._json_cache[key]
+
+    @contextmanager
+    def buffered(self, user_id: str, filler_name: str, file_key: str) -> Iterator[None]:
+        """
+        Coalesce every update of a JSON file made inside the block into a
+        single write, performed on exit.
+        """
+        key = (user_id, filler_name, self._map_key_to_file(file_key))
+        with self._json_lock:
+            self._json_buffered.add(key)
+        try:
+            yield
+        finally:
+            with self._json_lock:
+                self._json_buffered.discard(key)
+                try:
+                    self.flush(user_id, filler_name, file_key)
+                finally:
+                    # Nothing stays cached outside the block, even if the write failed
+                    self._invalidate_json_cache(*key)
+
+    def _invalidate_json_cache(self, user_id: str, filler_name: str, filename: Optional[str] = None):
+        """Drop cached JSON for a filler (or one of its files), pending writes included."""
+        with self._json_lock:
+            for key in list(self._json_cache):
+                if key[:2] == (user_id, filler_name) and filename in (None, key[2]):
+                    del self._json_cache[key]
+                    self._json_dirty.discard(key)
+
     # --- FILLER LOGS ---
 
     def get_filler_log(self, user_id: str, filler_name: str) -> str:
+        if self._filler_missing(user_id, filler_name):
+            return ""
         filler_paths = self.get_filler_paths(user_id, filler_name)
         path = filler_paths[FILLER_LOG_FILE]
         return path.read_text(encoding='utf-8') if path.exists() else ""
@@ -189,15 +332,21 @@ class FolderManager:
     # --- FILES (Uploads) ---
 
     def list_files(self, user_id: str, filler_name: str) -> List[str]:
+        """Names of the filler's uploaded files; [] if the filler does not exist."""
+        if self._filler_missing(user_id, filler_name):
+            return []
         filler_paths = self.get_filler_paths(user_id, filler_name)
         path = filler_paths[FILES_SUBDIR]
         return [f.name for f in path.iterdir() if f.is_file()]
 
-    def save_file(self, user_id: str, filler_name: str, filename: str, content: bytes):
+    def save_file(self, user_id: str, filler_name: str, filename: str, stream: IO[bytes]) -> Path:
+        """Stream an uploaded file to the filler's files/ directory in 64 KiB chunks."""
         filler_paths = self.get_filler_paths(user_id, filler_name)
         path = filler_paths[FILES_SUBDIR] / filename
-        path.write_bytes(content)
+        with open(path, "wb", buffering=65536) as dst:
+            shutil.copyfileobj(stream, dst, length=65536)
         self._make_db_log(user_id, "UPLOAD", "FILE", f"{filler_name}/{filename}")
+        return path
 
     def get_file_path(self, user_id, filler_name: str, filename: str) -> Path:
         filler_paths = self.get_filler_paths(user_id, filler_name)
@@ -213,6 +362,9 @@ class FolderManager:
     # --- RECORDS (PDFs & Screenshots) ---
 
     def list_records(self, user_id, filler_name: str, record_type: str) -> List[str]:
+        """Names of the filler's PDFs or screenshots; [] if the filler does not exist."""
+        if self._filler_missing(user_id, filler_name):
+            return []
         sub_dir = PDFS_SUBDIR if record_type == "pdfs" else SCREENSHOTS_SUBDIR
         filler_paths = self.get_filler_paths(user_id, filler_name)
         path = filler_paths[RECORD_SUBDIR] / sub_dir
@@ -229,7 +381,8 @@ class FolderManager:
                 target.unlink()
                 self._make_db_log(user_id, "DELETE", f"RECORD_{record_type.upper()}", f"{filler_name}/{filename}")
         else:
-            for f in path.iterdir(): f.unlink()
+            shutil.rmtree(path, ignore_errors=True)
+            path.mkdir(parents=True, exist_ok=True)
             self._make_db_log(user_id, "CLEAR", f"RECORDS_{record_type.upper()}", filler_name)
 
     def get_record_path(
@@ -245,25 +398,36 @@ class FolderManager:
     def _get_all_filler_files(self, user_id: str, filename: str) -> Dict[str, Any]:
         """
         Generic helper to scan all fillers for a specific JSON file.
+        Contents are shared with the parse cache and must not be mutated.
         """
         user_paths = self.get_user_paths(user_id)
         fillers_dir = user_paths[FILLERS_SUBDIR]
         all_content = {}
-        if not fillers_dir.exists():
+
+        # One directory snapshot; missing files surface as FileNotFoundError
+        # instead of being stat'ed beforehand
+        try:
+            with os.scandir(fillers_dir) as entries:
+                tasks = [
+                    (entry.name, Path(entry.path) / filename)
+                    for entry in entries if entry.is_dir(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
             return {}
 
-        for filler_path in fillers_dir.iterdir():
-            if filler_path.is_dir():
-                filler_name = filler_path.name
-                target_file = filler_path / filename
-
-                if target_file.exists():
-                    try:
-                        with open(target_file, 'r', encoding='utf-8') as f:
-                            all_content[filler_name] = json.load(f)
-                    except Exception as e:
-                        logger.error(f"Error reading {filename} for {filler_name}: {e}")
-                        all_content[filler_name] = {"error": str(e)}
+        def _load_one(task: Tuple[str, Path]) -> Tuple[str, Any]:
+            filler_name, target_file = task
+            try:
+                return filler_name, self._load_json(target_file)
+            except FileNotFoundError:
+                return filler_name, None
+            except Exception as e:
+                logger.error(f"Error reading {filename} for {filler_name}: {e}")
+                return filler_name, {"error": str(e)}
+
+        for filler_name, content in self._io_pool.map(_load_one, tasks):
+            if content is not None:
+                all_content[filler_name] = content
         return all_content
 
     def get_all_metadata(self, user_id: str) -> Dict[str, Any]:
@@ -281,20 +445,59 @@ class FolderManager:
     # --- UTILS ---
 
     def _map_key_to_file(self, key: str) -> str:
-        mapping = {
-            FileKeys.FORMDATA: FORMDATA_FILE,
-            FileKeys.CONFIG: CONFIG_FILE,
-            FileKeys.METADATA: METADATA_FILE
-        }
-        return mapping.get(key, f"{key}.json")
+        return _KEY_TO_FILE.get(key) or f"{key}.json"
 
-    def _read_json(self, path: Path) -> Dict[str, Any]:
-        if not path.exists(): return {}
+    def _load_json(self, path: Path) -> Any:
+        """
+        Parse a JSON file, reusing the previous result while the file is unchanged.
+        The returned object is shared with the cache: treat it as read-only.
+        """
+        st = os.stat(path)
+        # Atomic writes replace the inode, so st_ino catches same-tick rewrites
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        key = str(path)
+        hit = self._json_parse_cache.get(key)
+        if hit is not None and hit[0] == signature:
+            return hit[1]
+
+        data = orjson.loads(path.read_bytes())
+        self._json_parse_cache[key] = (signature, data)
+        return data
+
+    def _read_json(self, path: Path, *, fresh: bool = False) -> Dict[str, Any]:
+        """
+        Parse a JSON file, or return {} if it is missing or invalid.
+        The result is shared with the parse cache unless `fresh` is set, in
+        which case it is a new object the caller owns.
+        """
         try:
-            return json.loads(path.read_text(encoding='utf-8'))
-        except (json.JSONDecodeError, UnicodeDecodeError):
+            if fresh:
+                return orjson.loads(path.read_bytes())
+            return self._load_json(path)
+        except FileNotFoundError:
+            return {}
+        except orjson.JSONDecodeError:
             logger.error(f"Impossible {str(path)}.")
             return {}
 
     def _write_json(self, path: Path, data: Any):
-        path.write_text(json.dumps(data, indent=4, ensure_ascii=False), encoding='utf-8')
\ No newline at end of file
+        """
+        Write compact JSON atomically: serialize to a sibling temp file, then swap it in.
+        """
+        # Serialize before touching the disk so an unserializable value leaves no file
+        payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        try:
+            with open(tmp, "wb", buffering=65536) as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        self._json_parse_cache.pop(str(path), None)
+
+
+@functools.lru_cache(maxsize=None)
+def get_folder_manager(root_path: Path = Path.home() / ROOT_DIR) -> FolderManager:
+    """Return the shared FolderManager for a root directory, building it once."""
+    return FolderManager(root_path)
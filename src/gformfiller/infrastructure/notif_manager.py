@@ -7,15 +7,26 @@ from gformfiller.infrastructure.folder_manager import FolderManager
 from gformfiller.infrastructure.folder_manager.constants import (
     NOTIFICATIONS_DB
 )
+from gformfiller.infrastructure.folder_manager.db_logger import connect_db
 
 class NotifManager:
     def __init__(self, fm: FolderManager):
         self.fm = fm
+        # user_id -> notifications DB path, for users whose schema is already set up
+        self._ddl_done: Dict[str, Path] = {}
 
     def _get_notif_db(self, user_id):
+        notif_db = self._ddl_done.get(user_id)
+        if notif_db is not None:
+            return notif_db
+
         user_paths = self.fm.get_user_paths(user_id)
         notif_db = user_paths[NOTIFICATIONS_DB]
-        with sqlite3.connect(notif_db) as conn:
+        with connect_db(notif_db) as conn:
+            # Readers (polling clients) never block the worker adding notifications.
+            # No extra index: `id` is the rowid, so `WHERE id >= ? ORDER BY id`
+            # is already a range search on the table b-tree.
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS notifications (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -24,11 +35,12 @@ class NotifManager:
                     created_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+        self._ddl_done[user_id] = notif_db
         return notif_db
 
     def add_notification(self, user_id: str, filler_name: str, status: str):
         notif_db = self._get_notif_db(user_id)
-        with sqlite3.connect(notif_db) as conn:
+        with connect_db(notif_db) as conn:
             cursor = conn.execute(
                 "INSERT INTO notifications (filler_name, status) VALUES (?, ?)",
                 (filler_name, status)
@@ -37,7 +49,7 @@ class NotifManager:
 
     def get_notifications(self, user_id, last_id: int = 0) -> List[Dict[str, Any]]:
         notif_db = self._get_notif_db(user_id)
-        with sqlite3.connect(notif_db) as conn:
+        with connect_db(notif_db) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 "SELECT id, filler_name, status, created_at FROM notifications WHERE id >= ? ORDER BY id ASC",
@@ -47,7 +59,7 @@ class NotifManager:
 
     def get_notif_by_id(self, user_id: str, notif_id: int):
         notif_db = self._get_notif_db(user_id)
-        with sqlite3.connect(notif_db) as conn:
+        with connect_db(notif_db) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("SELECT * FROM notifications WHERE id = ?", (notif_id,))
             row = cursor.fetchone()
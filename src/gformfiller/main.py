@@ -1,5 +1,5 @@
 from fastapi import FastAPI
-from gformfiller.infrastructure.folder_manager import FolderManager
+from gformfiller.infrastructure.folder_manager import get_folder_manager
 from gformfiller.infrastructure.config_manager import ConfigManager
 from gformfiller.infrastructure.notif_manager import NotifManager
 from gformfiller.infrastructure.auth_manager import AuthManager
@@ -21,17 +21,26 @@ def create_app() -> FastAPI:
     logger = logging.getLogger(__name__)
     logger.setLevel(logging.DEBUG)
 
-    handler = logging.StreamHandler()
-    handler.setLevel(logging.DEBUG)
+    # Install the handler only once, however many times the app is built
+    if not any(isinstance(h, logging.StreamHandler) for h in logger.handlers):
+        handler = logging.StreamHandler()
+        handler.setLevel(logging.DEBUG)
 
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    handler.setFormatter(formatter)
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        handler.setFormatter(formatter)
 
-    logger.addHandler(handler)
+        logger.addHandler(handler)
     app = FastAPI(title="GFormFiller API", redirect_slashes=True)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
     # 1. Initialize Infrastructure
-    folder_manager = FolderManager()
+    folder_manager = get_folder_manager()
     config_manager = ConfigManager(folder_manager)
     notif_manager = NotifManager(folder_manager)
     auth_manager = AuthManager(folder_manager)
@@ -65,15 +74,9 @@ def run():
 
     args = parser.parse_args()
 
-    app = create_app()
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-    uvicorn.run(app, host=args.host, port=args.port)
+    # Built by uvicorn on startup, not at import, so importing this module
+    # creates no folders or threads (`uvicorn gformfiller.main:create_app --factory`)
+    uvicorn.run("gformfiller.main:create_app", factory=True, host=args.host, port=args.port)
 
 if __name__ == "__main__":
     run()
\ No newline at end of file
@@ -1,14 +1,19 @@
 # tests/unit/infrastructure/driver/test_chromedriver.py
 
 import pytest
-from unittest.mock import MagicMock, patch, call
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch, call
 from pathlib import Path
 
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+
 # Import exceptions and functions from the module under test
 from gformfiller.infrastructure.driver.chromedriver import (
     get_chromedriver,
     _get_chromeoptions,
     _get_chromeservice,
+    _options_recipe,
     quit_chromedriver,
 )
 from gformfiller.infrastructure.driver.exceptions import (
@@ -24,41 +29,32 @@ from gformfiller.infrastructure.driver.constants import (
 )
 
 
+CHROMEDRIVER_MODULE = "gformfiller.infrastructure.driver.chromedriver"
+_DEFAULT_CHROME_UA = DEFAULT_USER_AGENTS["chrome"]
+
+
 # --- Fixtures for Mocks ---
 
 @pytest.fixture
 def mock_path_exists():
     """Mock Path.exists() to simulate file existence checks."""
-    with patch("gformfiller.infrastructure.driver.chromedriver.Path.exists") as mock_exists:
+    with patch(f"{CHROMEDRIVER_MODULE}.Path.exists") as mock_exists:
         yield mock_exists
 
-@pytest.fixture
-def mock_webdriver_chrome():
-    """Mock selenium.webdriver.Chrome to simulate driver creation."""
-    with patch("gformfiller.infrastructure.driver.chromedriver.webdriver.Chrome") as mock_chrome:
-        mock_driver = MagicMock()
-        mock_chrome.return_value = mock_driver
-        yield mock_chrome
-
-@pytest.fixture
-def mock_configure_timeouts():
-    """Mock configure_timeouts to isolate timeout setup."""
-    with patch("gformfiller.infrastructure.driver.chromedriver.configure_timeouts") as mock_timeouts:
-        yield mock_timeouts
-
 @pytest.fixture
 def mock_chromeservice():
     """Mock ChromeService."""
-    with patch("gformfiller.infrastructure.driver.chromedriver.ChromeService") as mock_service:
+    with patch(f"{CHROMEDRIVER_MODULE}.ChromeService", spec=ChromeService) as mock_service:
         yield mock_service
 
 @pytest.fixture
 def mock_chromeoptions():
-    """Mock ChromeOptions."""
-    with patch("gformfiller.infrastructure.driver.chromedriver.ChromeOptions") as mock_options_class:
-        mock_options_instance = MagicMock()
-        mock_options_class.return_value = mock_options_instance
-        yield mock_options_instance
+    """Mock ChromeOptions with a fresh spec'd instance, so no option leaks between tests."""
+    options_instance = MagicMock(spec=ChromeOptions)
+    with patch(
+        f"{CHROMEDRIVER_MODULE}.ChromeOptions", return_value=options_instance
+    ):
+        yield options_instance
 
 
 # --- Tests for _get_chromeservice ---
@@ -68,10 +64,11 @@ def test_get_chromeservice_success(mock_path_exists, mock_chromeservice):
     mock_path_exists.return_value = True
     driver_path = "/path/to/chromedriver"
     
-    service = _get_chromeservice(driver_path)
+    service = _get_chromeservice(driver_path, 0)
     
-    mock_path_exists.assert_called_once_with()
-    mock_chromeservice.assert_called_once_with(executable_path=driver_path)
+    assert mock_path_exists.call_count == 1
+    assert mock_chromeservice.call_count == 1
+    assert mock_chromeservice.call_args == call(executable_path=driver_path, port=0)
 
 def test_get_chromeservice_driver_not_found(mock_path_exists):
     """Test _get_chromeservice raises DriverNotFoundError if path does not exist."""
@@ -79,9 +76,9 @@ def test_get_chromeservice_driver_not_found(mock_path_exists):
     driver_path = "/path/to/missing/chromedriver"
     
     with pytest.raises(DriverNotFoundError):
-        _get_chromeservice(driver_path)
+        _get_chromeservice(driver_path, 0)
     
-    mock_path_exists.assert_called_once_with()
+    assert mock_path_exists.call_count == 1
 
 
 # --- Tests for _get_chromeoptions ---
@@ -93,7 +90,7 @@ def test_get_chromeoptions_remote_mode(mock_chromeoptions):
         remote_host="192.168.1.1", remote_port=4444, headless=False,
         user_agent=None, disable_images=False, no_sandbox=False,
         disable_gpu=False, disable_dev_shm=False,
-        page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY
+        page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY, window_size=None
     )
     
     assert options.debugger_address == "192.168.1.1:4444"
@@ -111,10 +108,10 @@ def test_get_chromeoptions_binary_location_not_found(mock_chromeoptions, mock_pa
             remote_host=DEFAULT_REMOTE_HOST, remote_port=DEFAULT_REMOTE_PORT,
             headless=False, user_agent=None, disable_images=False,
             no_sandbox=False, disable_gpu=False, disable_dev_shm=False,
-            page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY
+            page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY, window_size=None
         )
     
-    mock_path_exists.assert_called_once_with()
+    assert mock_path_exists.call_count == 1
 
 def test_get_chromeoptions_standard_config(mock_chromeoptions, mock_path_exists):
     """Test _get_chromeoptions applies common configurations (headless, user-data, images, etc.)."""
@@ -135,7 +132,8 @@ def test_get_chromeoptions_standard_config(mock_chromeoptions, mock_path_exists)
         no_sandbox=True,
         disable_gpu=True,
         disable_dev_shm=False,
-        page_load_strategy="eager"
+        page_load_strategy="eager",
+        window_size=None
     )
 
     assert options.binary_location == binary_path
@@ -143,25 +141,24 @@ def test_get_chromeoptions_standard_config(mock_chromeoptions, mock_path_exists)
     mock_path_exists.assert_called_once()
     
     # Check added arguments
-    expected_calls = [
-        call(f"user-data-dir={user_data_dir}"),
-        call("--headless=new"),
-        call(f"user-agent={custom_user_agent}"),
-        call("--no-sandbox"),
-        call("--disable-gpu"),
-        call("--disable-blink-features=AutomationControlled"),
-        call("--disable-extensions"),
-        call("--disable-popup-blocking"),
-        call("--disable-notifications"),
-    ]
-    options.add_argument.assert_has_calls(expected_calls, any_order=True)
-
-    # Check experimental options
-    options.add_experimental_option.assert_has_calls([
-        call("prefs", {"profile.managed_default_content_settings.images": 2}),
-        call("excludeSwitches", ["enable-automation"]),
-        call("useAutomationExtension", False),
-    ], any_order=True)
+    expected_args = {
+        (f"user-data-dir={user_data_dir}",),
+        ("--headless=new",),
+        (f"user-agent={custom_user_agent}",),
+        ("--no-sandbox",),
+        ("--disable-gpu",),
+        ("--disable-blink-features=AutomationControlled",),
+        ("--disable-extensions",),
+        ("--disable-popup-blocking",),
+        ("--disable-notifications",),
+    }
+    assert expected_args <= {c.args for c in options.add_argument.call_args_list}
+
+    # Check experimental options (values may be unhashable, so compare by name)
+    experimental = {c.args[0]: c.args[1] for c in options.add_experimental_option.call_args_list}
+    assert experimental["prefs"] == {"profile.managed_default_content_settings.images": 2}
+    assert experimental["excludeSwitches"] == ["enable-automation"]
+    assert experimental["useAutomationExtension"] is False
 
 
 def test_get_chromeoptions_headless_default_user_agent(mock_chromeoptions, mock_path_exists):
@@ -174,10 +171,11 @@ def test_get_chromeoptions_headless_default_user_agent(mock_chromeoptions, mock_
         headless=True,
         user_agent=None,
         disable_images=False, no_sandbox=False, disable_gpu=False,
-        disable_dev_shm=False, page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY
+        disable_dev_shm=False, page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY,
+        window_size=None
     )
     
-    options.add_argument.assert_any_call(f"user-agent={DEFAULT_USER_AGENTS['chrome']}")
+    options.add_argument.assert_any_call(f"user-agent={_DEFAULT_CHROME_UA}")
 
 
 def test_get_chromeoptions_docker_config(mock_chromeoptions):
@@ -190,7 +188,7 @@ def test_get_chromeoptions_docker_config(mock_chromeoptions):
         no_sandbox=True,
         disable_gpu=True,
         disable_dev_shm=True,
-        page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY
+        page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY, window_size=None
     )
 
     options_instance = mock_chromeoptions
@@ -199,90 +197,132 @@ def test_get_chromeoptions_docker_config(mock_chromeoptions):
     options_instance.add_argument.assert_any_call("--disable-dev-shm-usage")
 
 
+def test_get_chromeoptions_reuses_recipe_for_identical_config():
+    """Identical configurations share a cached recipe but get independent ChromeOptions."""
+    kwargs = dict(
+        binary_location=None, user_data_dir=None, remote=False,
+        remote_host=DEFAULT_REMOTE_HOST, remote_port=DEFAULT_REMOTE_PORT,
+        headless=True, user_agent=None, disable_images=True,
+        no_sandbox=True, disable_gpu=False, disable_dev_shm=False,
+        page_load_strategy=DEFAULT_PAGE_LOAD_STRATEGY, window_size=None
+    )
+    _options_recipe.cache_clear()
+
+    first = _get_chromeoptions(**kwargs)
+    first.experimental_options["prefs"]["mutated"] = 1
+    second = _get_chromeoptions(**kwargs)
+
+    assert _options_recipe.cache_info().hits == 1
+    assert first is not second
+    assert second.arguments == first.arguments
+    assert "mutated" not in second.experimental_options["prefs"]
+
+
 # --- Tests for get_chromedriver ---
 
-# Mock internal dependencies to isolate get_chromedriver
-@patch("gformfiller.infrastructure.driver.chromedriver._get_chromeoptions")
-@patch("gformfiller.infrastructure.driver.chromedriver._get_chromeservice")
-def test_get_chromedriver_success(
-    mock_get_service, mock_get_options, mock_webdriver_chrome, mock_configure_timeouts
-):
-    """Test successful creation and configuration of the Chromedriver instance."""
-    
-    mock_options = MagicMock()
-    mock_service = MagicMock()
-    mock_get_options.return_value = mock_options
-    mock_get_service.return_value = mock_service
-
-    driver_path = "/path/to/driver"
-    page_load_timeout = 60
-    script_timeout = 15
-    implicit_wait = 5
-    
-    driver = get_chromedriver(
-        driver_path=driver_path,
-        page_load_timeout=page_load_timeout,
-        script_timeout=script_timeout,
-        implicit_wait=implicit_wait
-    )
+class TestGetChromedriver:
+    """get_chromedriver with its collaborators patched once for the whole class."""
+
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def chrome_patches(cls):
+        """Patch the driver factory's collaborators once and share the mocks."""
+        with patch.multiple(
+            CHROMEDRIVER_MODULE,
+            _get_chromeoptions=DEFAULT,
+            _get_chromeservice=DEFAULT,
+            configure_timeouts=DEFAULT,
+        ) as mocks, patch(f"{CHROMEDRIVER_MODULE}.webdriver.Chrome") as mock_chrome:
+            mocks["Chrome"] = mock_chrome
+            cls.mocks = SimpleNamespace(**mocks)
+            yield
+
+    @pytest.fixture(autouse=True)
+    def reset_patches(self):
+        """Give every test clean mocks without rebuilding them."""
+        for mock in vars(self.mocks).values():
+            mock.reset_mock(return_value=True, side_effect=True)
+
+    def test_get_chromedriver_success(self):
+        """Test successful creation and configuration of the Chromedriver instance."""
+        mock_options = MagicMock()
+        mock_service = MagicMock()
+        self.mocks._get_chromeoptions.return_value = mock_options
+        self.mocks._get_chromeservice.return_value = mock_service
+
+        driver_path = "/path/to/driver"
+        page_load_timeout = 60
+        script_timeout = 15
+        implicit_wait = 5
+
+        driver = get_chromedriver(
+            driver_path=driver_path,
+            page_load_timeout=page_load_timeout,
+            script_timeout=script_timeout,
+            implicit_wait=implicit_wait
+        )
 
-    mock_get_options.assert_called_once()
-    mock_get_service.assert_called_once_with(driver_path)
-    mock_webdriver_chrome.assert_called_once_with(options=mock_options, service=mock_service)
-    
-    # Verify timeouts are configured
-    mock_configure_timeouts.assert_called_once_with(
-        driver, page_load_timeout, script_timeout, implicit_wait
-    )
+        self.mocks._get_chromeoptions.assert_called_once()
+        assert self.mocks._get_chromeservice.call_count == 1
+        assert self.mocks._get_chromeservice.call_args == call(driver_path, 0)
+        assert self.mocks.Chrome.call_count == 1
+        assert self.mocks.Chrome.call_args == call(options=mock_options, service=mock_service)
 
+        # Verify timeouts are configured
+        assert self.mocks.configure_timeouts.call_count == 1
+        assert self.mocks.configure_timeouts.call_args == call(
+            driver, page_load_timeout, script_timeout, implicit_wait
+        )
 
-@patch("gformfiller.infrastructure.driver.chromedriver._get_chromeoptions")
-@patch("gformfiller.infrastructure.driver.chromedriver._get_chromeservice")
-def test_get_chromedriver_driver_not_found_re_raised(mock_get_service, mock_get_options):
-    """Test that DriverNotFoundError from service creation is propagated."""
-    mock_get_service.side_effect = DriverNotFoundError("chrome", "/bad/path")
-    
-    with pytest.raises(DriverNotFoundError):
-        get_chromedriver(driver_path="/bad/path")
+    def test_get_chromedriver_driver_not_found_re_raised(self):
+        """Test that DriverNotFoundError from service creation is propagated."""
+        self.mocks._get_chromeservice.side_effect = DriverNotFoundError("chrome", "/bad/path")
 
-@patch("gformfiller.infrastructure.driver.chromedriver._get_chromeoptions")
-@patch("gformfiller.infrastructure.driver.chromedriver._get_chromeservice")
-def test_get_chromedriver_browser_not_found_re_raised(mock_get_service, mock_get_options):
-    """Test that BrowserNotFoundError from options creation is propagated."""
-    mock_get_options.side_effect = BrowserNotFoundError("chrome", "/bad/binary")
-    
-    with pytest.raises(BrowserNotFoundError):
-        get_chromedriver(driver_path="/path/to/driver", binary_location="/bad/binary")
+        with pytest.raises(DriverNotFoundError):
+            get_chromedriver(driver_path="/bad/path")
 
-@patch("gformfiller.infrastructure.driver.chromedriver._get_chromeoptions")
-@patch("gformfiller.infrastructure.driver.chromedriver._get_chromeservice")
-def test_get_chromedriver_creation_failure_caught(mock_get_service, mock_get_options, mock_webdriver_chrome):
-    """Test that any other Exception during WebDriver instantiation is caught and wrapped in DriverCreationError."""
-    
-    mock_get_options.return_value = MagicMock()
-    mock_get_service.return_value = MagicMock()
-    
-    # Simulate an error during WebDriver instantiation
-    test_exception = Exception("Connection failed")
-    mock_webdriver_chrome.side_effect = test_exception
-    
-    with pytest.raises(DriverCreationError):
-        get_chromedriver(driver_path="/path/to/driver")
+    def test_get_chromedriver_browser_not_found_re_raised(self):
+        """Test that BrowserNotFoundError from options creation is propagated."""
+        self.mocks._get_chromeoptions.side_effect = BrowserNotFoundError("chrome", "/bad/binary")
+
+        with pytest.raises(BrowserNotFoundError):
+            get_chromedriver(driver_path="/path/to/driver", binary_location="/bad/binary")
+
+    def test_get_chromedriver_creation_failure_caught(self):
+        """Test that any other Exception during WebDriver instantiation is caught and wrapped in DriverCreationError."""
+        # Simulate an error during WebDriver instantiation
+        self.mocks.Chrome.side_effect = Exception("Connection failed")
+
+        with pytest.raises(DriverCreationError):
+            get_chromedriver(driver_path="/path/to/driver")
 
 
 # --- Tests for quit_chromedriver ---
 
-@patch("gformfiller.infrastructure.driver.chromedriver.quit_webdriver")
-def test_quit_chromedriver_calls_generic(mock_quit_webdriver):
-    """Test that quit_chromedriver calls the generic quit_webdriver function."""
-    mock_driver = MagicMock()
-    quit_chromedriver(mock_driver)
-    
-    mock_quit_webdriver.assert_called_once_with(mock_driver)
+class TestQuitChromedriver:
 
-@patch("gformfiller.infrastructure.driver.chromedriver.quit_webdriver")
-def test_quit_chromedriver_with_none(mock_quit_webdriver):
-    """Test that quit_chromedriver handles None input."""
-    quit_chromedriver(None)
-    
-    mock_quit_webdriver.assert_called_once_with(None)
\ No newline at end of file
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def quit_patch(cls):
+        with patch(f"{CHROMEDRIVER_MODULE}.quit_webdriver") as mock_quit_webdriver:
+            cls.mock_quit_webdriver = mock_quit_webdriver
+            yield
+
+    @pytest.fixture(autouse=True)
+    def reset_patch(self):
+        self.mock_quit_webdriver.reset_mock()
+
+    def test_quit_chromedriver_calls_generic(self):
+        """Test that quit_chromedriver calls the generic quit_webdriver function."""
+        mock_driver = MagicMock()
+        quit_chromedriver(mock_driver)
+
+        assert self.mock_quit_webdriver.call_count == 1
+        assert self.mock_quit_webdriver.call_args == call(mock_driver)
+
+    def test_quit_chromedriver_with_none(self):
+        """Test that quit_chromedriver handles None input."""
+        quit_chromedriver(None)
+
+        assert self.mock_quit_webdriver.call_count == 1
+        assert self.mock_quit_webdriver.call_args == call(None)
@@ -1,5 +1,7 @@
 import pytest
 from gformfiller.infrastructure.dsl.evaluator import Evaluator
+from gformfiller.infrastructure.dsl.compiler import estimate_cost, reorder_by_cost
+from gformfiller.infrastructure.dsl.codegen import compile_predicate, emit
 from gformfiller.infrastructure.dsl.ast_nodes import (
     WordNode, QuotedStringNode, AndNode, OrNode, NotNode, BeforeNode
 )
@@ -8,6 +10,14 @@ from gformfiller.infrastructure.dsl.ast_nodes import (
 def evaluator():
     return Evaluator()
 
+class SpyText(str):
+    """Text that counts the literal searches run against it."""
+    checked = 0
+
+    def __contains__(self, value):
+        self.checked += 1
+        return super().__contains__(value)
+
 def test_literal_match(evaluator):
     node = WordNode("python")
     assert evaluator.evaluate(node, "I love python programming") is True
@@ -87,4 +97,82 @@ def test_complex_before_with_or(evaluator, text, expected):
 def test_empty_text(evaluator):
     node = WordNode("something")
     assert evaluator.evaluate(node, "") is False
-    assert evaluator.evaluate(node, None) is False
\ No newline at end of file
+    assert evaluator.evaluate(node, None) is False
+
+
+COMPILED_NODES = [
+    WordNode("python"),
+    AndNode(WordNode("fast"), WordNode("furious")),
+    OrNode(WordNode("cat"), NotNode(WordNode("dog"))),
+    NotNode(AndNode(WordNode("a"), OrNode(WordNode("b"), WordNode("c")))),
+    BeforeNode(OrNode(WordNode("start"), WordNode("begin")), WordNode("end")),
+    AndNode(BeforeNode(WordNode("a"), WordNode("b")), NotNode(WordNode("c"))),
+    BeforeNode(WordNode(""), WordNode("a")),
+]
+COMPILED_TEXTS = [
+    "I love python", "fast and furious", "a cat", "a dog", "b then a",
+    "start the process and end it", "end before start", "a b c", "",
+]
+
+
+def test_generated_predicate_short_circuits():
+    """The right operand of AND/OR is not evaluated when the left one decides."""
+    predicate = compile_predicate(AndNode(WordNode("absent"), WordNode("text")))
+    text = SpyText("some text")
+    assert predicate(text) is False
+    assert text.checked == 1
+
+    predicate = compile_predicate(OrNode(WordNode("some"), WordNode("absent")))
+    text = SpyText("some text")
+    assert predicate(text) is True
+    assert text.checked == 1
+
+
+def test_reorder_runs_cheaper_operand_first():
+    """An AND with an expensive BEFORE on the left checks the plain word first."""
+    node = AndNode(BeforeNode(WordNode("first"), WordNode("last")), WordNode("name"))
+    reordered = reorder_by_cost(node)
+
+    assert reordered.left == WordNode("name")
+    assert estimate_cost(node) == estimate_cost(reordered) == 5
+    # The source tree is not modified
+    assert isinstance(node.left, BeforeNode)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("first name then last name", True),
+    ("last, first, then last again", True),  # a later "last" still counts
+    ("last then first", False),
+    ("first first", False),
+    ("only last", False),
+])
+def test_generated_before_between_literals(evaluator, text, expected):
+    """BEFORE on two literals compares positions without the generic search."""
+    node = BeforeNode(WordNode("first"), WordNode("last"))
+
+    assert compile_predicate(node)(text) is expected
+    assert evaluator.evaluate(node, text) is expected
+
+
+@pytest.mark.parametrize("node", COMPILED_NODES)
+@pytest.mark.parametrize("text", COMPILED_TEXTS)
+def test_generated_predicate_matches_tree_walk(evaluator, node, text):
+    """The generated Python predicate gives the same answer as walking the AST."""
+    assert compile_predicate(node)(text) is evaluator.evaluate(node, text)
+
+
+def test_generated_predicate_inlines_literal_before():
+    """BEFORE on two literals is written as plain find/rfind, no helper call."""
+    nodes = []
+    source = emit(BeforeNode(WordNode("first"), WordNode("last")), nodes)
+
+    assert source == "(-1 < t.find('first') < t.rfind('last'))"
+    assert nodes == []
+
+
+def test_generated_predicate_quotes_literals():
+    """Literal values are embedded as string constants, never as code."""
+    predicate = compile_predicate(QuotedStringNode("') or True or ('\\"))
+
+    assert predicate("anything") is False
+    assert predicate("x ') or True or ('\\ y") is True
@@ -97,4 +97,43 @@ def test_match_empty_inputs():
     assert dsl.match("", "A & B") is False
     
     # Empty expression and text, should return True
-    assert dsl.match("", "") is True
\ No newline at end of file
+    assert dsl.match("", "") is True
+
+
+def test_match_reuses_compiled_expression():
+    """The same expression is lexed and parsed once, whatever the text."""
+    dsl._compile.cache_clear()
+
+    assert dsl.match("first name", "FIRST & name") is True
+    assert dsl.match("last name", "FIRST & name") is False
+
+    info = dsl._compile.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+    # Case sensitivity is part of the key
+    assert dsl.match("first name", "FIRST & name", ignore_case=False) is False
+    assert dsl._compile.cache_info().misses == 2
+
+
+def test_match_many_agrees_with_match():
+    """match_many gives the same answer as match for each text of the batch."""
+    expression = "(Email | courriel) & ~confirm"
+    texts = ["Email address", "Adresse COURRIEL", "Confirm email", "Phone", ""]
+
+    assert dsl.match_many(texts, expression) == [dsl.match(t, expression) for t in texts]
+    assert dsl.match_many(texts, expression) == [True, True, False, False, False]
+
+
+def test_match_many_invalid_expression_returns_none_per_text():
+    assert dsl.match_many(["a", "b"], "A & (B") == [None, None]
+    assert dsl.match_many(["a", "b"], "") == [True, True]
+
+
+def test_match_deeply_nested_expression():
+    """Expressions too deep for Python's compiler still evaluate correctly."""
+    dsl._compile.cache_clear()
+    expression = "~" * 301 + "a"
+
+    assert dsl.match("b", expression) is True
+    assert dsl.match("a", expression) is False
@@ -128,4 +128,20 @@ def test_error_unbalanced_parens(parse_helper):
             (TokenType.WORD, "A"),
             (TokenType.OR, "|"),
             (TokenType.WORD, "B"),
-        ])
\ No newline at end of file
+        ])
+
+def test_binary_operators_are_left_associative(parse_helper):
+    """Test logic: A < B < C is (A < B) < C"""
+    ast = parse_helper([
+        (TokenType.WORD, "A"),
+        (TokenType.BEFORE, "<"),
+        (TokenType.WORD, "B"),
+        (TokenType.BEFORE, "<"),
+        (TokenType.WORD, "C"),
+    ])
+
+    assert isinstance(ast, BeforeNode)
+    assert isinstance(ast.left, BeforeNode)
+    assert ast.left.left.value == "A"
+    assert ast.left.right.value == "B"
+    assert ast.right.value == "C"
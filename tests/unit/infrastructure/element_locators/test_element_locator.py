@@ -1,7 +1,6 @@
 # tests/unit/infrastructure/element_locators/test_element_locator.py
 
 import pytest
-from unittest.mock import Mock, patch
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
 
@@ -12,17 +11,40 @@ from gformfiller.infrastructure.element_locators.element_locator import (
     InvalidStrategyError
 )
 
-# --- Mocks for simulating Selenium ---
+# --- Fakes for simulating Selenium ---
+
+class FakeContext:
+    """
+    Stands in for a WebDriver or WebElement: records each lookup and returns
+    `result`, or raises `error` when one is set.
+    """
+    __slots__ = ("calls", "all_calls", "result", "error")
+
+    def __init__(self, result=None, error=None):
+        self.calls = []      # find_element arguments
+        self.all_calls = []  # find_elements arguments
+        self.result = result
+        self.error = error
+
+    def find_element(self, *args):
+        self.calls.append(args)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def find_elements(self, *args):
+        self.all_calls.append(args)
+        return self.result
 
 @pytest.fixture
-def mock_context():
-    """Mocks a WebDriver or WebElement instance for testing."""
-    return Mock()
+def fake_context():
+    """A fake WebDriver or WebElement instance for testing."""
+    return FakeContext()
 
 @pytest.fixture
-def locator(mock_context):
-    """Initializes ElementLocator with a mock context."""
-    return ElementLocator(mock_context)
+def locator(fake_context):
+    """Initializes ElementLocator with a fake context."""
+    return ElementLocator(fake_context)
 
 # --- Core Locator Tests ---
 
@@ -33,37 +55,38 @@ def locator(mock_context):
     (GoogleFormElement.QUESTION_DESCRIPTION, ".//div[@role='heading']/following-sibling::div[1]"),
     (GoogleFormElement.NEXT_BUTTON, "(//div[@role='list']/following-sibling::div[1]//div[@role='button' and not(@aria-label='Submit')])[2]")
 ])
-def test_locate_calls_find_element_with_correct_xpath(locator, mock_context, element_enum, expected_xpath):
-    # Configure the mock to return a simulated result
-    mock_element = Mock()
-    mock_context.find_element.return_value = mock_element
+def test_locate_calls_find_element_with_correct_xpath(locator, fake_context, element_enum, expected_xpath):
+    # Configure the fake to return a simulated result
+    element = object()
+    fake_context.result = element
 
     # Call the method under test
     found_element = locator.locate(element_enum)
 
     # Assertions: Check if Selenium's method was called correctly
-    mock_context.find_element.assert_called_once_with(By.XPATH, expected_xpath)
-    assert found_element == mock_element
+    assert fake_context.calls == [(By.XPATH, expected_xpath)]
+    assert found_element is element
 
 # Test 2: Verify that locate_all is called with the correct XPATH and returns all elements
-def test_locate_all_calls_find_elements(locator, mock_context):
+def test_locate_all_calls_find_elements(locator, fake_context):
     expected_xpath = "//div[@role='button' and @aria-label='Submit']"
     
-    # Configure the mock to return a list of simulated results
-    mock_elements = [Mock(), Mock(), Mock()]
-    mock_context.find_elements.return_value = mock_elements
+    # Configure the fake to return a list of simulated results
+    elements = [object(), object(), object()]
+    fake_context.result = elements
 
     found_elements = locator.locate_all(GoogleFormElement.SUBMIT_BUTTON)
 
     # Assertions
-    mock_context.find_elements.assert_called_once_with(By.XPATH, expected_xpath)
-    assert found_elements == mock_elements
+    assert fake_context.all_calls == [(By.XPATH, expected_xpath)]
+    assert fake_context.calls == []
+    assert found_elements == elements
     assert len(found_elements) == 3
 
 # Test 3: Verify that locate raises ElementNotFoundError if Selenium fails
-def test_locate_raises_element_not_found_error(locator, mock_context):
-    # Configure the mock to simulate a Selenium search failure
-    mock_context.find_element.side_effect = NoSuchElementException("Element not found")
+def test_locate_raises_element_not_found_error(locator, fake_context):
+    # Configure the fake to simulate a Selenium search failure
+    fake_context.error = NoSuchElementException("Element not found")
 
     with pytest.raises(ElementNotFoundError) as excinfo:
         locator.locate(GoogleFormElement.QUESTION)
@@ -75,9 +98,9 @@ def test_locate_raises_element_not_found_error(locator, mock_context):
 # --- Strategy and Edge Case Tests ---
 
 # Test 4: Verify locating an element when switching to a strategy with an empty selector
-def test_locate_raises_error_for_empty_selector(mock_context):
+def test_locate_raises_error_for_empty_selector(fake_context):
     # Initialize locator with CSS strategy
-    locator = ElementLocator(mock_context, strategy=LocalizationStrategy.CSS_LOCATOR)
+    locator = ElementLocator(fake_context, strategy=LocalizationStrategy.CSS_LOCATOR)
 
     # Since SUBMIT_BUTTON has no CSS selector in constants.py, it should fail before calling Selenium
     with pytest.raises(ElementNotFoundError) as excinfo:
@@ -86,10 +109,10 @@ def test_locate_raises_error_for_empty_selector(mock_context):
     # Assertions
     assert "SUBMIT_BUTTON" in str(excinfo.value)
     assert "CSS_LOCATOR" in str(excinfo.value)
-    mock_context.find_element.assert_not_called()
+    assert fake_context.calls == []
 
 # Test 5: Verify locate_all returns an empty list if the selector is empty
-def test_locate_all_returns_empty_list_for_empty_selector(locator, mock_context):
+def test_locate_all_returns_empty_list_for_empty_selector(locator, fake_context):
     # Change the strategy to CSS (which is empty for most of your elements)
     locator.set_strategy(LocalizationStrategy.CSS_LOCATOR)
     
@@ -98,15 +121,15 @@ def test_locate_all_returns_empty_list_for_empty_selector(locator, mock_context)
     # Assertions
     assert result == []
     # Check that find_elements was not called unnecessarily
-    mock_context.find_elements.assert_not_called()
+    assert fake_context.all_calls == []
 
 # Test 6: Verify locate_all returns an empty list if Selenium finds nothing
-def test_locate_all_returns_empty_list_when_no_elements_are_found(locator, mock_context):
-    # Configure the mock to return an empty list
-    mock_context.find_elements.return_value = []
+def test_locate_all_returns_empty_list_when_no_elements_are_found(locator, fake_context):
+    # Configure the fake to return an empty list
+    fake_context.result = []
     
     result = locator.locate_all(GoogleFormElement.QUESTION)
     
     # Assertions
     assert result == []
-    mock_context.find_elements.assert_called_once()
\ No newline at end of file
+    assert len(fake_context.all_calls) == 1
\ No newline at end of file
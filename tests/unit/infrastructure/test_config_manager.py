@@ -1,8 +1,10 @@
 # tests/unit/infrastructure/test_config_manager.py
 
 import pytest
+from unittest.mock import patch
 from gformfiller.infrastructure.folder_manager import FolderManager
 from gformfiller.infrastructure.config_manager import ConfigManager
+from gformfiller.domain.schemas.config import FillerConfig
 
 @pytest.fixture
 def config_setup(tmp_path):
@@ -41,4 +43,29 @@ def test_invalid_config_raises_error(config_setup):
     fm.update_filler_file_content("test_error", "config", {"wait_time": "beaucoup"})
     
     with pytest.raises(Exception): # Pydantic ValidationError
-        cm.get_resolved_config("test_error")
\ No newline at end of file
+        cm.get_resolved_config("test_error")
+
+
+def test_resolved_config_is_cached_until_inputs_change(tmp_path):
+    fm = FolderManager(tmp_path)
+    cm = ConfigManager(fm)
+    fm.create_filler("alice", "cached")
+    fm.update_filler_file_content("alice", "cached", "config", {"wait_time": 5.0})
+
+    with patch.object(FillerConfig, "model_validate", wraps=FillerConfig.model_validate) as validate:
+        first = cm.get_resolved_config("alice", "cached")
+        second = cm.get_resolved_config("alice", "cached")
+        assert validate.call_count == 1
+        assert first == second and first is not second
+
+        # A new override is picked up
+        fm.update_filler_file_content("alice", "cached", "config", {"wait_time": 7.0})
+        assert cm.get_resolved_config("alice", "cached").wait_time == 7.0
+        assert validate.call_count == 2
+
+        # So is a new default
+        cm.update_default_config({"profile": "global_profile"})
+        assert cm.get_resolved_config("alice", "cached").profile == "global_profile"
+        assert validate.call_count == 3
+
+    fm.close()
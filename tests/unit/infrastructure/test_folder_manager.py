@@ -1,14 +1,21 @@
 # tests/unit/infrastructure/test_folder_manager.py
 
+import io
+import queue
+import shutil
 import pytest
 import sqlite3
+import orjson
 from gformfiller.infrastructure.folder_manager import FolderManager
 from gformfiller.infrastructure.folder_manager.constants import GLOBAL_LOG_DB
 
 @pytest.fixture
 def fm(tmp_path):
     """Initialise un FolderManager dans un dossier temporaire."""
-    return FolderManager(tmp_path)
+    manager = FolderManager(tmp_path)
+    yield manager
+    # Arrête le thread d'écriture des logs et le pool d'E/S de chaque test
+    manager.close()
 
 def test_base_structure_creation(fm, tmp_path):
     assert (tmp_path / "profiles").exists()
@@ -35,4 +42,211 @@ def test_json_content_update(fm):
     fm.update_filler_file_content("test_json", "config", data)
     
     content = fm.get_filler_file_content("test_json", "config")
-    assert content["key"] == "value"
\ No newline at end of file
+    assert content["key"] == "value"
+
+def test_json_roundtrip_preserves_unicode(fm, tmp_path):
+    path = tmp_path / "data.json"
+    fm._write_json(path, {"prénom": "Élodie", 1: "int key"})
+
+    assert fm._read_json(path) == {"prénom": "Élodie", "1": "int key"}
+
+def test_read_json_invalid_content_returns_empty(fm, tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_bytes(b"{not json")
+
+    assert fm._read_json(path) == {}
+
+def test_write_json_leaves_no_temp_file(fm, tmp_path):
+    path = tmp_path / "config.json"
+    fm._write_json(path, {"a": 1})
+    fm._write_json(path, {"a": 2})
+
+    assert fm._read_json(path) == {"a": 2}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+def test_failed_write_json_leaves_no_temp_file(fm, tmp_path, mocker):
+    path = tmp_path / "config.json"
+    fm._write_json(path, {})
+
+    with pytest.raises(TypeError):
+        fm._write_json(path, {"x": {1, 2}})
+    mocker.patch("os.replace", side_effect=OSError("disk full"))
+    with pytest.raises(OSError):
+        fm._write_json(path, {"a": 1})
+
+    assert list(tmp_path.glob("*.tmp")) == []
+    assert fm._read_json(path) == {}
+
+def test_buffered_updates_are_written_once(fm, mocker):
+    fm.create_filler("user", "buffered")
+    write_spy = mocker.spy(fm, "_write_json")
+
+    with fm.buffered("user", "buffered", "formdata"):
+        fm.update_filler_file_content("user", "buffered", "formdata", {"a": 1})
+        fm.update_filler_file_content("user", "buffered", "formdata", {"b": 2})
+        assert write_spy.call_count == 0
+
+    assert write_spy.call_count == 1
+    path = fm.get_filler_paths("user", "buffered")["root"] / "formdata.json"
+    assert fm._read_json(path) == {"a": 1, "b": 2}
+
+def test_cached_content_is_isolated_from_callers(fm):
+    fm.create_filler("user", "isolated")
+    fm.update_filler_file_content("user", "isolated", "config", {"nested": {"k": 1}})
+
+    content = fm.get_filler_file_content("user", "isolated", "config")
+    content["nested"]["k"] = 2
+
+    assert fm.get_filler_file_content("user", "isolated", "config") == {"nested": {"k": 1}}
+
+def test_failed_write_does_not_update_cache(fm):
+    fm.create_filler("user", "unsaved")
+
+    with pytest.raises(TypeError):
+        fm.update_filler_file_content("user", "unsaved", "config", {"x": {1, 2}})
+
+    assert fm.get_filler_file_content("user", "unsaved", "config") == {}
+
+def test_recreated_filler_drops_cached_content(fm):
+    fm.create_filler("user", "recreated")
+    fm.update_filler_file_content("user", "recreated", "config", {"a": 1})
+
+    # Removed behind the manager's back, then created again
+    shutil.rmtree(fm.get_filler_paths("user", "recreated")["root"])
+    fm.create_filler("user", "recreated")
+
+    assert fm.get_filler_file_content("user", "recreated", "config") == {}
+
+def test_content_changed_on_disk_is_seen(fm):
+    fm.create_filler("user", "external")
+    fm.update_filler_file_content("user", "external", "config", {"a": 1})
+    path = fm.get_filler_paths("user", "external")["root"] / "config.json"
+
+    # Another process (or a person) edits the file
+    path.write_bytes(orjson.dumps({"a": 1, "edited": True}))
+
+    assert fm.get_filler_file_content("user", "external", "config") == {"a": 1, "edited": True}
+    fm.update_filler_file_content("user", "external", "config", {"b": 2})
+    assert fm._read_json(path) == {"a": 1, "edited": True, "b": 2}
+
+def test_buffered_content_is_not_kept_after_block(fm):
+    fm.create_filler("user", "block")
+
+    with fm.buffered("user", "block", "formdata"):
+        fm.update_filler_file_content("user", "block", "formdata", {"a": 1})
+        assert fm.get_filler_file_content("user", "block", "formdata") == {"a": 1}
+
+    assert fm._json_cache == {}
+    assert fm.get_filler_file_content("user", "block", "formdata") == {"a": 1}
+
+def test_get_all_metadata_reads_every_filler(fm):
+    for name in ("a", "b", "c"):
+        fm.create_filler("user", name)
+    fm.get_filler_paths("user", "c")["metadata.json"].unlink()
+
+    all_metadata = fm.get_all_metadata("user")
+
+    assert set(all_metadata) == {"a", "b"}
+    assert all_metadata["a"]["status"] == "pending"
+
+def test_create_filler_builds_directory_tree(fm):
+    fm.create_filler("user", "tree")
+    paths = fm.get_filler_paths("user", "tree")
+
+    for key in ("root", "files", "record", "record_pdfs", "record_screenshots"):
+        assert paths[key].is_dir()
+    assert paths["log.txt"].is_file()
+
+def test_missing_filler_is_short_circuited_until_created(fm):
+    assert fm.get_filler_log("user", "ghost") == ""
+    assert fm.list_files("user", "ghost") == []
+    assert ("user", "ghost") in fm._neg_cache
+
+    fm.create_filler("user", "ghost")
+
+    assert ("user", "ghost") not in fm._neg_cache
+    assert fm.list_files("user", "ghost") == []
+    assert fm.list_records("user", "ghost", "pdfs") == []
+
+def test_listing_a_missing_filler_returns_empty_lists(fm):
+    # Never created: no FileNotFoundError from the missing directories
+    assert fm.list_files("user", "never") == []
+    assert fm.list_records("user", "never", "pdfs") == []
+    assert fm.list_records("user", "never", "screenshots") == []
+
+    fm.create_filler("user", "deleted")
+    (fm.get_filler_paths("user", "deleted")["files"] / "doc.pdf").write_bytes(b"pdf")
+    fm.delete_filler("user", "deleted")
+
+    assert fm.list_files("user", "deleted") == []
+    assert fm.list_records("user", "deleted", "pdfs") == []
+
+def test_delete_all_records_empties_directory(fm):
+    fm.create_filler("user", "records")
+    screenshots = fm.get_filler_paths("user", "records")["record_screenshots"]
+    for i in range(3):
+        (screenshots / f"shot_{i}.png").write_bytes(b"png")
+
+    fm.delete_record("user", "records", "screenshots")
+
+    assert screenshots.is_dir()
+    assert fm.list_records("user", "records", "screenshots") == []
+
+def test_db_logger_is_reused_per_user(fm):
+    assert fm.get_db_logger("alice") is fm.get_db_logger("alice")
+    assert fm.get_db_logger("alice") is not fm.get_db_logger("bob")
+
+def test_db_logs_are_written_in_background(fm):
+    fm.create_filler("user", "logged")
+    fm.update_filler_file_content("user", "logged", "config", {"a": 1})
+
+    logs = fm.get_db_logger("user").get_logs()
+
+    assert [log["action"] for log in logs] == ["UPDATE", "CREATE"]
+
+def test_log_flush_gives_up_when_writer_is_stuck(fm):
+    worker = fm._log_worker
+    # The writer keeps waiting on its own queue and never sees the flush request
+    writer_queue, worker._queue = worker._queue, queue.SimpleQueue()
+    try:
+        assert worker.flush(timeout=0.05) is False
+    finally:
+        worker._queue = writer_queue
+
+    assert worker.flush() is True
+
+def test_stopped_log_worker_is_unregistered_from_atexit(fm, mocker):
+    unregister = mocker.patch("atexit.unregister")
+
+    fm.close()
+
+    unregister.assert_called_once_with(fm._log_worker.stop)
+
+def test_save_file_streams_content(fm):
+    fm.create_filler("user", "uploads")
+    payload = b"x" * 200_000
+
+    path = fm.save_file("user", "uploads", "doc.pdf", io.BytesIO(payload))
+
+    assert path.read_bytes() == payload
+    assert fm.list_files("user", "uploads") == ["doc.pdf"]
+
+def test_read_json_reuses_parse_until_file_changes(fm, tmp_path, mocker):
+    path = tmp_path / "metadata.json"
+    fm._write_json(path, {"status": "pending"})
+    loads_spy = mocker.spy(orjson, "loads")
+
+    assert fm._read_json(path) == {"status": "pending"}
+    assert fm._read_json(path) == {"status": "pending"}
+    assert loads_spy.call_count == 1
+
+    fm._write_json(path, {"status": "completed"})
+
+    assert fm._read_json(path) == {"status": "completed"}
+    assert loads_spy.call_count == 2
+
+def test_write_json_is_compact(fm, tmp_path):
+    path = tmp_path / "formdata.json"
+
+    fm._write_json(path, {"a": [1, 2]})
+    assert path.read_bytes() == b'{"a":[1,2]}'